@@ -1,9 +1,15 @@
+using System.Numerics;
+using System.Runtime.InteropServices;
 using Astrolabe.Core.FileFormats;
+using Astrolabe.Core.FileFormats.Geometry;
 
 namespace Astrolabe.Cli.Commands;
 
 public static class AnalyzeCommand
 {
+    // Vertex components must satisfy |v| < 100000; the largest float below it makes the inclusive test strict
+    private static readonly float VertexLimit = MathF.BitDecrement(100000f);
+
     public static int Run(string[] args)
     {
         if (args.Length == 0)
@@ -28,7 +34,7 @@ public static class AnalyzeCommand
             }
 
             // Block 05:01 is the "Fix" block in Montreal - contains the globals struct
-            var fixBlock = loader.Sna.Blocks.FirstOrDefault(b => b.Module == 0x05 && b.Id == 0x01);
+            var fixBlock = loader.Sna.GetBlock(0x05, 0x01);
             if (fixBlock?.Data == null)
             {
                 Console.WriteLine("Fix block not found!");
@@ -65,90 +71,21 @@ public static class AnalyzeCommand
             Console.WriteLine("\n=== Scanning ALL blocks for GeometricObject headers ===");
             int totalFound = 0;
 
-            foreach (var block in loader.Sna.Blocks.Where(b => b.Data != null && b.Data.Length > 100))
-            {
-                int baseAddr = block.BaseInMemory;
-                int endAddr = baseAddr + block.Data!.Length;
-                int found = 0;
+            // Blocks scan independently; collect per block so output keeps block order
+            var blocks = loader.Sna.Blocks.Where(b => b.Data != null && b.Data.Length > 100).ToArray();
+            var blockResults = new List<string>[blocks.Length];
+            Parallel.For(0, blocks.Length, i => blockResults[i] = FindGeometricObjects(blocks[i]));
 
-                using var ms = new MemoryStream(block.Data);
-                using var reader = new BinaryReader(ms);
+            for (int i = 0; i < blocks.Length; i++)
+            {
+                if (blockResults[i].Count == 0) continue;
 
-                for (int offset = 0; offset < block.Data.Length - 64; offset += 4)
+                Console.WriteLine($"\n[{blocks[i].Module:X2}:{blocks[i].Id:X2}] GeometricObjects:");
+                foreach (var line in blockResults[i])
                 {
-                    ms.Position = offset;
-
-                    uint numVertices = reader.ReadUInt32();
-                    if (numVertices < 3 || numVertices > 10000) continue;
-
-                    int offVerts = reader.ReadInt32();
-                    int offNormals = reader.ReadInt32();
-                    int offMaterials = reader.ReadInt32();
-                    reader.ReadInt32(); // skip
-                    uint numElements = reader.ReadUInt32();
-
-                    if (numElements == 0 || numElements > 1000) continue;
-
-                    // Check if the vertex/normal pointers look valid (pointing within this block)
-                    bool vertsValid = offVerts >= baseAddr && offVerts < endAddr;
-                    bool normalsValid = offNormals >= baseAddr && offNormals < endAddr;
-
-                    if (vertsValid && normalsValid)
-                    {
-                        // Validate vertex data at the pointer location
-                        int vertOffset = offVerts - baseAddr;
-                        if (vertOffset >= 0 && vertOffset + numVertices * 12 <= block.Data.Length)
-                        {
-                            ms.Position = vertOffset;
-                            float x = reader.ReadSingle();
-                            float z = reader.ReadSingle();
-                            float y = reader.ReadSingle();
-
-                            // Only count meshes with non-trivial vertex data
-                            if (!float.IsNaN(x) && !float.IsInfinity(x) &&
-                                Math.Abs(x) < 100000 && Math.Abs(y) < 100000 && Math.Abs(z) < 100000)
-                            {
-                                // Calculate bounding box to filter out all-zero meshes
-                                ms.Position = vertOffset;
-                                float minX = float.MaxValue, maxX = float.MinValue;
-                                float minY = float.MaxValue, maxY = float.MinValue;
-                                float minZ = float.MaxValue, maxZ = float.MinValue;
-                                bool hasVariation = false;
-
-                                for (int v = 0; v < numVertices; v++)
-                                {
-                                    float vx = reader.ReadSingle();
-                                    float vz = reader.ReadSingle();
-                                    float vy = reader.ReadSingle();
-
-                                    if (!float.IsNaN(vx) && !float.IsInfinity(vx))
-                                    {
-                                        minX = Math.Min(minX, vx); maxX = Math.Max(maxX, vx);
-                                        minY = Math.Min(minY, vy); maxY = Math.Max(maxY, vy);
-                                        minZ = Math.Min(minZ, vz); maxZ = Math.Max(maxZ, vz);
-                                    }
-                                }
-
-                                float sizeX = maxX - minX;
-                                float sizeY = maxY - minY;
-                                float sizeZ = maxZ - minZ;
-                                hasVariation = sizeX > 0.01f || sizeY > 0.01f || sizeZ > 0.01f;
-
-                                if (hasVariation)
-                                {
-                                    if (found == 0)
-                                    {
-                                        Console.WriteLine($"\n[{block.Module:X2}:{block.Id:X2}] GeometricObjects:");
-                                    }
-                                    Console.WriteLine($"  +0x{offset:X}: {numVertices} verts, {numElements} elems, size=({sizeX:F2}, {sizeY:F2}, {sizeZ:F2})");
-                                    found++;
-                                    totalFound++;
-                                    if (found >= 10) break; // Limit per block
-                                }
-                            }
-                        }
-                    }
+                    Console.WriteLine(line);
                 }
+                totalFound += blockResults[i].Count;
             }
 
             Console.WriteLine($"\nTotal GeometricObjects with variation: {totalFound}");
@@ -156,18 +93,18 @@ public static class AnalyzeCommand
             // Debug: show pointer stats
             Console.WriteLine("\n=== Pointer validation stats ===");
             int vertPtrCount = 0, normPtrCount = 0, elemTypePtrCount = 0, elemsPtrCount = 0;
+            var memory = new MemoryContext(loader.Sna, loader.Rtb);
+
+            // Walk the known pointer locations rather than probing every header offset
+            var pointerLocations = memory.GetPointerLocations();
             foreach (var block in loader.Sna.Blocks.Where(b => b.Data != null && b.Data.Length > 100))
             {
                 int baseAddr = block.BaseInMemory;
-                for (int offset = 0; offset < block.Data!.Length - 64; offset += 4)
-                {
-                    int memAddr = baseAddr + offset;
-                    var memory = new MemoryContext(loader.Sna, loader.Rtb);
-                    if (memory.GetPointerAt(memAddr + 4) != null) vertPtrCount++;
-                    if (memory.GetPointerAt(memAddr + 8) != null) normPtrCount++;
-                    if (memory.GetPointerAt(memAddr + 24) != null) elemTypePtrCount++;
-                    if (memory.GetPointerAt(memAddr + 28) != null) elemsPtrCount++;
-                }
+                int limit = block.Data!.Length - 64;
+                vertPtrCount += CountPointersAtField(pointerLocations, baseAddr, limit, 4);
+                normPtrCount += CountPointersAtField(pointerLocations, baseAddr, limit, 8);
+                elemTypePtrCount += CountPointersAtField(pointerLocations, baseAddr, limit, 24);
+                elemsPtrCount += CountPointersAtField(pointerLocations, baseAddr, limit, 28);
             }
             Console.WriteLine($"Potential vert ptrs: {vertPtrCount}");
             Console.WriteLine($"Potential norm ptrs: {normPtrCount}");
@@ -183,4 +120,120 @@ public static class AnalyzeCommand
             return 1;
         }
     }
+
+    /// <summary>
+    /// Scans one block for GeometricObject headers whose vertex data has
+    /// variation, returning up to 10 formatted result lines.
+    /// </summary>
+    private static List<string> FindGeometricObjects(SnaBlock block)
+    {
+        var data = block.Data!;
+        int baseAddr = block.BaseInMemory;
+        int endAddr = baseAddr + data.Length;
+        var results = new List<string>();
+
+        // Decode the block once: headers sit on 4-byte boundaries, so index them as words
+        var words = MemoryMarshal.Cast<byte, int>(data.AsSpan());
+        int limit = data.Length - 64;
+        int wordLimit = limit > 0 ? (limit + 3) / 4 : 0;
+
+        for (int offset = 0; offset < limit; offset += 4)
+        {
+            // Jump to the next word whose vertex and element counts are both in range
+            int candidate = MeshScanner.FindHeaderCandidate(MemoryMarshal.Cast<int, uint>(words), offset / 4, wordLimit);
+            if (candidate < 0) break;
+            offset = candidate * 4;
+
+            var header = words.Slice(offset / 4, 6);
+
+            uint numVertices = (uint)header[0];
+            if (numVertices < 3 || numVertices > 10000) continue;
+
+            int offVerts = header[1];
+            int offNormals = header[2];
+            uint numElements = (uint)header[5];
+
+            if (numElements == 0 || numElements > 1000) continue;
+
+            // Check if the vertex/normal pointers look valid (pointing within this block)
+            bool vertsValid = offVerts >= baseAddr && offVerts < endAddr;
+            bool normalsValid = offNormals >= baseAddr && offNormals < endAddr;
+
+            if (vertsValid && normalsValid)
+            {
+                // Validate vertex data at the pointer location
+                int vertOffset = offVerts - baseAddr;
+                if (vertOffset >= 0 && vertOffset + numVertices * 12 <= data.Length)
+                {
+                    var verts = MemoryMarshal.Cast<byte, float>(data.AsSpan(vertOffset, (int)numVertices * 12));
+
+                    var bits = MemoryMarshal.Cast<float, uint>(verts);
+
+                    // Only count meshes with non-trivial vertex data, judged by the first vertex
+                    // (the range test also rejects NaN and infinity)
+                    if (MeshScanner.CountLeadingWithin(bits[..3], VertexLimit) == 3)
+                    {
+                        // Calculate bounding box to filter out all-zero meshes, skipping
+                        // vertices with a non-finite X. When every component is in range
+                        // nothing is skipped, so the shared vectorized reduction applies.
+                        var vectors = MemoryMarshal.Cast<float, Vector3>(verts);
+                        var (min, max) = MeshScanner.CountLeadingWithin(bits, VertexLimit) == bits.Length
+                            ? MeshData.GetBounds(vectors)
+                            : GetFiniteBounds(vectors);
+                        var extent = max - min;
+                        float sizeX = extent.X;
+                        float sizeY = extent.Z;
+                        float sizeZ = extent.Y;
+                        bool hasVariation = sizeX > 0.01f || sizeY > 0.01f || sizeZ > 0.01f;
+
+                        if (hasVariation)
+                        {
+                            results.Add($"  +0x{offset:X}: {numVertices} verts, {numElements} elems, size=({sizeX:F2}, {sizeY:F2}, {sizeZ:F2})");
+                            if (results.Count >= 10) break; // Limit per block
+                            offset += 60; // Skip past this structure, as MeshScanner does
+                        }
+                    }
+                }
+            }
+        }
+
+        return results;
+    }
+
+    private static (Vector3 Min, Vector3 Max) GetFiniteBounds(ReadOnlySpan<Vector3> vertices)
+    {
+        var min = new Vector3(float.MaxValue);
+        var max = new Vector3(float.MinValue);
+        foreach (var v in vertices)
+        {
+            if (float.IsFinite(v.X))
+            {
+                min = Vector3.Min(min, v);
+                max = Vector3.Max(max, v);
+            }
+        }
+
+        return (min, max);
+    }
+
+    /// <summary>
+    /// Counts header starts at 4-byte offsets in [0, limit) of a block whose field at
+    /// fieldOffset is a known pointer, using the sorted pointer locations.
+    /// </summary>
+    private static int CountPointersAtField(ReadOnlySpan<int> sortedLocations, int baseAddr, int limit, int fieldOffset)
+    {
+        if (limit <= 0) return 0;
+
+        int first = baseAddr + fieldOffset;
+        int index = sortedLocations.BinarySearch(first);
+        if (index < 0) index = ~index;
+
+        int count = 0;
+        for (; index < sortedLocations.Length && sortedLocations[index] - first < limit; index++)
+        {
+            if (((sortedLocations[index] - first) & 3) == 0)
+                count++;
+        }
+        return count;
+    }
 }
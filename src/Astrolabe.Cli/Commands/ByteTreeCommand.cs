@@ -188,13 +188,13 @@ public static class ByteTreeCommand
         {
             // Scan GPT for pointers that reference orphan data
             gpt.ScanForPointers();
-            PrintGptPointers(gpt, tracker, coverage, loader.Sna.Blocks.ToList());
+            PrintGptPointers(gpt, tracker, coverage, memory);
             Console.WriteLine();
         }
 
         if (showOrphans)
         {
-            PrintOrphans(coverage, loader.Sna.Blocks);
+            PrintOrphans(coverage, memory);
         }
 
         return 0;
@@ -217,13 +217,11 @@ public static class ByteTreeCommand
         }
     }
 
-    private static void PrintOrphans(CoverageStats coverage, IEnumerable<SnaBlock> blocks)
+    private static void PrintOrphans(CoverageStats coverage, MemoryContext memory)
     {
         Console.WriteLine("Uncovered Regions (Orphans):");
         Console.WriteLine();
 
-        var blockList = blocks.ToList();
-
         // Group by block and show significant orphans
         var orphansByBlock = coverage.UncoveredRegions
             .Where(r => r.Length >= 16) // Skip tiny gaps (likely padding)
@@ -240,9 +238,7 @@ public static class ByteTreeCommand
             // Show largest orphan regions
             foreach (var region in regions.Take(5))
             {
-                var block = blockList.FirstOrDefault(b =>
-                    b.BaseInMemory <= region.Start &&
-                    b.BaseInMemory + (b.Data?.Length ?? 0) > region.Start);
+                var block = memory.GetBlockContaining(region.Start);
 
                 if (block?.Data != null)
                 {
@@ -267,20 +263,15 @@ public static class ByteTreeCommand
 
     private static string GetHexPreview(byte[] data, int offset, int length)
     {
-        var bytes = new List<string>();
-        for (int i = 0; i < length && offset + i < data.Length; i++)
-        {
-            bytes.Add(data[offset + i].ToString("X2"));
-        }
-
-        var hex = string.Join(" ", bytes);
+        var count = Math.Max(0, Math.Min(length, data.Length - offset));
+        var hex = count > 0 ? HexDump.FormatBytes(data.AsSpan(offset, count)).TrimEnd() : string.Empty;
         if (length < 32 || offset + length > data.Length)
             return hex;
         return hex + "...";
     }
 
     private static void PrintGptPointers(GptReader gpt, ByteRangeTracker tracker,
-        CoverageStats coverage, List<SnaBlock> blocks)
+        CoverageStats coverage, MemoryContext memory)
     {
         Console.WriteLine("GPT Pointer Roots (references to orphan data):");
         Console.WriteLine();
@@ -327,9 +318,7 @@ public static class ByteTreeCommand
             Console.WriteLine($"  Orphan region @ 0x{orphan.Start:X8} ({orphan.Length:N0} bytes):");
 
             // Find the block containing this orphan
-            var block = blocks.FirstOrDefault(b =>
-                b.BaseInMemory <= orphan.Start &&
-                b.BaseInMemory + (b.Data?.Length ?? 0) > orphan.Start);
+            var block = memory.GetBlockContaining(orphan.Start);
 
             if (block?.Data != null)
             {
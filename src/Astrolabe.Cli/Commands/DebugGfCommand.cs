@@ -28,10 +28,12 @@ public static class DebugGfCommand
 
             // Hex dump first 64 bytes
             Console.WriteLine("\nFirst 64 bytes:");
-            for (int i = 0; i < Math.Min(64, data.Length); i++)
+            int dumpLength = Math.Min(64, data.Length);
+            for (int i = 0; i < dumpLength; i += 16)
             {
-                Console.Write($"{data[i]:X2} ");
-                if ((i + 1) % 16 == 0) Console.WriteLine();
+                var line = HexDump.FormatBytes(data.AsSpan(i, Math.Min(16, dumpLength - i)));
+                if (i + 16 <= dumpLength) Console.WriteLine(line);
+                else Console.Write(line);
             }
             Console.WriteLine();
 
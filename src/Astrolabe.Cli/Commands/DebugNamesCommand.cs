@@ -33,14 +33,8 @@ public static class DebugNamesCommand
                 for (int i = 0; i < 256; i += 16)
                 {
                     int lineAddr = addr - 64 + i;
-                    Console.Write($"{lineAddr:X8}: ");
                     byte[] bytes = reader.ReadBytes(16);
-                    foreach (var b in bytes)
-                        Console.Write($"{b:X2} ");
-                    Console.Write(" ");
-                    foreach (var b in bytes)
-                        Console.Write(b >= 0x20 && b < 0x7F ? (char)b : '.');
-                    Console.WriteLine();
+                    Console.WriteLine($"{lineAddr:X8}: {HexDump.FormatBytes(bytes)} {HexDump.FormatAscii(bytes)}");
                 }
             }
             return 0;
@@ -17,11 +17,16 @@ public static class DebugPointerProbeCommand
             var bytes = OpenSpaceExporter.PreviewStructuredElementBytes(args[0], args[1], args[2]);
             Console.WriteLine($"Length: {bytes.Length}");
             Console.WriteLine(Convert.ToHexString(bytes).ToLowerInvariant());
-            for (var offset = 0; offset <= bytes.Length - 4; offset += 4)
+            var values = new int[bytes.Length / 4];
+            for (var i = 0; i < values.Length; i++)
             {
-                var value = BitConverter.ToInt32(bytes, offset);
-                var target = OpenSpaceExporter.FindTargetBlockKey(args[0], value);
-                Console.WriteLine($"  0x{offset:X2}: 0x{unchecked((uint)value):X8} -> {target ?? "none"}");
+                values[i] = BitConverter.ToInt32(bytes, i * 4);
+            }
+
+            var targets = OpenSpaceExporter.FindTargetBlockKeys(args[0], values);
+            for (var i = 0; i < values.Length; i++)
+            {
+                Console.WriteLine($"  0x{i * 4:X2}: 0x{unchecked((uint)values[i]):X8} -> {targets[i] ?? "none"}");
             }
 
             return 0;
@@ -72,10 +72,9 @@ public static class DebugSnaCommand
                 if (shown++ >= 3) break;
 
                 Console.WriteLine($"\nBlock [{block.Module:X2}:{block.Id:X2}] (Base=0x{block.BaseInMemory:X8}, {block.Data.Length} bytes):");
-                for (int i = 0; i < 64; i++)
+                for (int i = 0; i < 64; i += 16)
                 {
-                    Console.Write($"{block.Data[i]:X2} ");
-                    if ((i + 1) % 16 == 0) Console.WriteLine();
+                    Console.WriteLine(HexDump.FormatBytes(block.Data.AsSpan(i, 16)));
                 }
             }
 
@@ -230,7 +230,8 @@ public static class ExtractCommand
 
             bool isVignette = Path.GetFileName(cntPath).Equals("Vignette.cnt", StringComparison.OrdinalIgnoreCase);
 
-            foreach (var file in cnt.Files)
+            // GF decode and PNG encode are CPU-bound and independent per file
+            Parallel.ForEach(cnt.Files, file =>
             {
                 try
                 {
@@ -246,13 +247,13 @@ public static class ExtractCommand
                     }
 
                     gf.SaveAsPng(outputPath);
-                    extracted++;
+                    Interlocked.Increment(ref extracted);
                 }
                 catch
                 {
-                    failed++;
+                    Interlocked.Increment(ref failed);
                 }
-            }
+            });
 
             Console.WriteLine($"    -> {extracted} textures" + (failed > 0 ? $" ({failed} failed)" : ""));
         }
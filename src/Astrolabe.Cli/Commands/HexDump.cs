@@ -0,0 +1,39 @@
+namespace Astrolabe.Cli.Commands;
+
+/// <summary>
+/// Formats raw bytes for the debug commands' hex dumps.
+/// </summary>
+internal static class HexDump
+{
+    private const string HexDigits = "0123456789ABCDEF";
+
+    /// <summary>
+    /// Formats bytes as uppercase hex pairs, each followed by a space.
+    /// </summary>
+    public static string FormatBytes(ReadOnlySpan<byte> bytes)
+    {
+        var chars = new char[bytes.Length * 3];
+        for (int i = 0; i < bytes.Length; i++)
+        {
+            byte b = bytes[i];
+            chars[i * 3] = HexDigits[b >> 4];
+            chars[i * 3 + 1] = HexDigits[b & 0xF];
+            chars[i * 3 + 2] = ' ';
+        }
+        return new string(chars);
+    }
+
+    /// <summary>
+    /// Formats bytes as printable ASCII, with '.' for anything else.
+    /// </summary>
+    public static string FormatAscii(ReadOnlySpan<byte> bytes)
+    {
+        var chars = new char[bytes.Length];
+        for (int i = 0; i < bytes.Length; i++)
+        {
+            byte b = bytes[i];
+            chars[i] = b >= 0x20 && b < 0x7F ? (char)b : '.';
+        }
+        return new string(chars);
+    }
+}
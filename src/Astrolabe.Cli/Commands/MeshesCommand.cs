@@ -57,13 +57,8 @@ public static class MeshesCommand
                 Console.WriteLine($"  {mesh.Name}: {mesh.NumVertices} verts, {mesh.NumElements} elems, {triCount} tris{texInfo}");
                 if (mesh.Vertices.Length > 0)
                 {
-                    var minX = mesh.Vertices.Min(v => v.X);
-                    var maxX = mesh.Vertices.Max(v => v.X);
-                    var minY = mesh.Vertices.Min(v => v.Y);
-                    var maxY = mesh.Vertices.Max(v => v.Y);
-                    var minZ = mesh.Vertices.Min(v => v.Z);
-                    var maxZ = mesh.Vertices.Max(v => v.Z);
-                    Console.WriteLine($"    Bounds: X[{minX:F2}, {maxX:F2}] Y[{minY:F2}, {maxY:F2}] Z[{minZ:F2}, {maxZ:F2}]");
+                    var (min, max) = mesh.GetBounds();
+                    Console.WriteLine($"    Bounds: X[{min.X:F2}, {max.X:F2}] Y[{min.Y:F2}, {max.Y:F2}] Z[{min.Z:F2}, {max.Z:F2}]");
                 }
             }
 
@@ -29,7 +29,8 @@ public static class TexturesCommand
             int extracted = 0;
             int failed = 0;
 
-            foreach (var file in cnt.Files)
+            // GF decode and PNG encode are CPU-bound and independent per file
+            Parallel.ForEach(cnt.Files, file =>
             {
                 try
                 {
@@ -47,18 +48,18 @@ public static class TexturesCommand
                     }
 
                     gf.SaveAsPng(outputPath);
-                    extracted++;
+                    int done = Interlocked.Increment(ref extracted);
 
-                    if (extracted % 100 == 0)
+                    if (done % 100 == 0)
                     {
-                        Console.Write($"\r[{extracted}/{cnt.FileCount}] Extracted...                    ");
+                        Console.Write($"\r[{done}/{cnt.FileCount}] Extracted...                    ");
                     }
                 }
                 catch
                 {
-                    failed++;
+                    Interlocked.Increment(ref failed);
                 }
-            }
+            });
 
             Console.WriteLine();
             Console.WriteLine($"Extracted: {extracted} textures");
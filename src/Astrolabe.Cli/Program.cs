@@ -1,3 +1,4 @@
+using System.Text;
 using Astrolabe.Cli.Commands;
 
 namespace Astrolabe.Cli;
@@ -22,16 +23,16 @@ class Program
             "list" => ListCommand.Run(args[1..]),
             "textures" => TexturesCommand.Run(args[1..]),
             "cnt" => CntCommand.Run(args[1..]),
-            "debug-gf" => DebugGfCommand.Run(args[1..]),
-            "debug-sna" => DebugSnaCommand.Run(args[1..]),
-            "debug-relocations" => DebugRelocationsCommand.Run(args[1..]),
-            "debug-pointer-probe" => DebugPointerProbeCommand.Run(args[1..]),
-            "debug-names" => DebugNamesCommand.Run(args[1..]),
+            "debug-gf" => RunBuffered(() => DebugGfCommand.Run(args[1..])),
+            "debug-sna" => RunBuffered(() => DebugSnaCommand.Run(args[1..])),
+            "debug-relocations" => RunBuffered(() => DebugRelocationsCommand.Run(args[1..])),
+            "debug-pointer-probe" => RunBuffered(() => DebugPointerProbeCommand.Run(args[1..])),
+            "debug-names" => RunBuffered(() => DebugNamesCommand.Run(args[1..])),
             "meshes" => MeshesCommand.Run(args[1..]),
-            "analyze" => AnalyzeCommand.Run(args[1..]),
+            "analyze" => RunBuffered(() => AnalyzeCommand.Run(args[1..])),
             "textures-sna" => TexturesSnaCommand.Run(args[1..]),
             "scene" => SceneCommand.Run(args[1..]),
-            "tree" => TreeCommand.Run(args[1..]),
+            "tree" => RunBuffered(() => TreeCommand.Run(args[1..])),
             "byte-tree" => ByteTreeCommand.Run(args[1..]),
             "export-godot" => ExportGodotCommand.Run(args[1..]),
             "audio" => AudioCommand.Run(args[1..]),
@@ -41,6 +42,38 @@ class Program
         };
     }
 
+    /// <summary>
+    /// Runs a dump command with stdout batched through a 64 KiB buffer when it is
+    /// piped or redirected, since Console.Out flushes on every line.
+    /// </summary>
+    static int RunBuffered(Func<int> run)
+    {
+        if (!Console.IsOutputRedirected)
+        {
+            return run();
+        }
+
+        var stdout = Console.Out;
+        var buffered = new StreamWriter(Console.OpenStandardOutput(), GetOutputEncoding(), bufferSize: 1 << 16);
+        Console.SetOut(buffered);
+        try
+        {
+            return run();
+        }
+        finally
+        {
+            buffered.Flush();
+            Console.SetOut(stdout);
+        }
+    }
+
+    static Encoding GetOutputEncoding()
+    {
+        // Avoid writing a UTF-8 BOM at the start of a redirected file.
+        var encoding = Console.OutputEncoding;
+        return encoding.CodePage == Encoding.UTF8.CodePage ? new UTF8Encoding(false) : encoding;
+    }
+
     static int Help()
     {
         PrintUsage();
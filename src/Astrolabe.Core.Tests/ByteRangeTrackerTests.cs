@@ -0,0 +1,72 @@
+using Astrolabe.Core.FileFormats;
+using Xunit;
+
+namespace Astrolabe.Core.Tests;
+
+public sealed class ByteRangeTrackerTests
+{
+    [Fact]
+    public void ComputeCoverage_CountsRangesThatStartBeforeTheBlock()
+    {
+        var tracker = new ByteRangeTracker();
+        tracker.Record(0x0F00, 0x180, "spans into first block");
+        tracker.Record(0x2010, 0x10, "inside second block");
+        tracker.Record(0x0100, 0x10, "before every block");
+
+        var blocks = new[]
+        {
+            new SnaBlock { Module = 0x05, Id = 0x01, BaseInMemory = 0x1000, Data = new byte[0x100] },
+            new SnaBlock { Module = 0x06, Id = 0x01, BaseInMemory = 0x2000, Data = new byte[0x40] }
+        };
+
+        var stats = tracker.ComputeCoverage(blocks);
+
+        Assert.Equal(0x140, stats.TotalBytes);
+        Assert.Equal(0x80 + 0x10, stats.CoveredBytes);
+        Assert.Equal(0x80, stats.BlockStats[0].CoveredBytes);
+        Assert.Equal(0x10, stats.BlockStats[1].CoveredBytes);
+        Assert.Contains(new ByteRange(0x1080, 0x80, "Block [05:01]"), stats.UncoveredRegions);
+        Assert.Contains(new ByteRange(0x2000, 0x10, "Block [06:01]"), stats.UncoveredRegions);
+        Assert.Contains(new ByteRange(0x2020, 0x20, "Block [06:01]"), stats.UncoveredRegions);
+    }
+
+    [Fact]
+    public void ComputeCoverage_MatchesEveryRangeAgainstEveryBlock()
+    {
+        var random = new Random(5);
+        for (var trial = 0; trial < 50; trial++)
+        {
+            var blocks = Enumerable.Range(0, random.Next(1, 6))
+                .Select(i => new SnaBlock
+                {
+                    Module = 0x05,
+                    Id = (byte)i,
+                    BaseInMemory = 0x1000 * (i + 1) + random.Next(0, 0x800),
+                    Data = new byte[random.Next(1, 0x400)]
+                })
+                .ToArray();
+
+            var tracker = new ByteRangeTracker();
+            for (var i = random.Next(0, 40); i > 0; i--)
+            {
+                tracker.Record(random.Next(0x0800, 0x7000), random.Next(1, i % 7 == 0 ? 0x2000 : 0x100), "range");
+            }
+
+            var stats = tracker.ComputeCoverage(blocks);
+
+            // Brute force: mark every byte of every block each range touches
+            var expectedCovered = 0;
+            for (var b = 0; b < blocks.Length; b++)
+            {
+                var block = blocks[b];
+                var covered = Enumerable.Range(block.BaseInMemory, block.Data!.Length)
+                    .Count(address => tracker.Ranges.Any(r => address >= r.Start && address < r.End));
+                Assert.Equal(covered, stats.BlockStats[b].CoveredBytes);
+                expectedCovered += covered;
+            }
+
+            Assert.Equal(expectedCovered, stats.CoveredBytes);
+            Assert.Equal(stats.TotalBytes - stats.CoveredBytes, stats.UncoveredRegions.Sum(r => r.Length));
+        }
+    }
+}
@@ -0,0 +1,63 @@
+using System.Collections.Concurrent;
+using Astrolabe.Core.Extraction;
+using Xunit;
+
+namespace Astrolabe.Core.Tests;
+
+public sealed class GameSourceFactoryTests
+{
+    [Fact]
+    public void ExtractFiles_CopiesEveryFileAndReportsEachOnce()
+    {
+        var workspace = Path.Combine(Path.GetTempPath(), "astrolabe-extract-" + Guid.NewGuid().ToString("N"));
+        try
+        {
+            var sourceDir = Path.Combine(workspace, "disc");
+            var outputDir = Path.Combine(workspace, "out");
+            var random = new Random(3);
+            var expected = new Dictionary<string, byte[]>();
+            for (var i = 0; i < 24; i++)
+            {
+                // Sizes straddle the copy buffer so partial and multi-chunk copies both run
+                var relative = $"Gamedata/{(i % 3 == 0 ? "World/" : "")}file{i}.bin";
+                var data = new byte[random.Next(0, 3 << 20)];
+                random.NextBytes(data);
+                var path = Path.Combine(sourceDir, relative.Replace('/', Path.DirectorySeparatorChar));
+                Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+                File.WriteAllBytes(path, data);
+                expected[relative] = data;
+            }
+
+            var reports = new ConcurrentBag<ExtractionProgress>();
+            using var source = new DirectoryGameSource(sourceDir);
+            GameSourceFactory.ExtractFiles(source, outputDir, progress: new CollectingProgress(reports));
+
+            foreach (var (relative, data) in expected)
+            {
+                var extracted = File.ReadAllBytes(Path.Combine(outputDir, relative.Replace('/', Path.DirectorySeparatorChar)));
+                Assert.Equal(data, extracted);
+            }
+
+            Assert.Equal(
+                expected.Keys.Order(StringComparer.Ordinal).ToArray(),
+                reports.Select(r => r.CurrentFile).Order(StringComparer.Ordinal).ToArray());
+            Assert.Equal(
+                Enumerable.Range(1, expected.Count).ToArray(),
+                reports.Select(r => r.ExtractedCount).Order().ToArray());
+            Assert.All(reports, r => Assert.Equal(expected.Count, r.TotalFiles));
+        }
+        finally
+        {
+            if (Directory.Exists(workspace))
+            {
+                Directory.Delete(workspace, recursive: true);
+            }
+        }
+    }
+
+    // Progress<T> posts asynchronously, so collect reports synchronously from the worker threads
+    private sealed class CollectingProgress(ConcurrentBag<ExtractionProgress> reports) : IProgress<ExtractionProgress>
+    {
+        public void Report(ExtractionProgress value) => reports.Add(value);
+    }
+}
@@ -0,0 +1,182 @@
+using Astrolabe.Core.FileFormats;
+using Xunit;
+
+namespace Astrolabe.Core.Tests;
+
+public sealed class GfReaderTests
+{
+    [Fact]
+    public void DecodeToRgba_ExpandsRunsAndLiteralsPerChannel()
+    {
+        // 2x1 RGB565: the lo-byte plane is one run of 0x1F, the hi-byte plane two literals
+        var gf = BuildGf(type: 10, width: 2, height: 1, channels: 2, repeatByte: 0xAA, pixelCount: 2,
+            palette: [], paletteBytesPerColor: 0, raw: [0xAA, 0x1F, 0x02, 0xF8, 0x07]);
+
+        var reader = new GfReader(gf);
+
+        Assert.Equal(GfFormat.RGB565, reader.Format);
+        Assert.Equal(new byte[] { 0xAA, 0x1F, 0x02, 0xF8, 0x07 }, reader.RawPixelData.ToArray());
+        Assert.Equal(new byte[] { 255, 0, 255, 255, 0, 226, 255, 255 }, reader.DecodeToRgba());
+    }
+
+    [Fact]
+    public void DecodeToRgba_MatchesPerPixelReference()
+    {
+        var random = new Random(7);
+        for (var trial = 0; trial < 300; trial++)
+        {
+            byte type = new byte[] { 5, 10, 11, 12, 99 }[random.Next(5)];
+            byte channels = type switch
+            {
+                5 => 1,
+                99 => (byte)random.Next(1, 4),
+                _ => 2
+            };
+            var width = random.Next(1, 20);
+            var height = random.Next(1, 20);
+            var pixelCount = width * height + random.Next(0, 10);
+            var repeatByte = (byte)random.Next(0, 3);
+            var paletteBytesPerColor = type == 5 ? (byte)random.Next(3, 5) : (byte)0;
+            var palette = new byte[type == 5 ? random.Next(1, 257) * paletteBytesPerColor : 0];
+            random.NextBytes(palette);
+
+            // Bias towards the repeat byte so runs, short tails and literals all occur
+            var raw = new byte[random.Next(pixelCount * channels / 2, pixelCount * channels + 20)];
+            for (var i = 0; i < raw.Length; i++)
+            {
+                raw[i] = (byte)(random.Next(3) == 0 ? random.Next(0, 3) : random.Next(256));
+            }
+
+            var gf = BuildGf(type, width, height, channels, repeatByte, pixelCount,
+                palette, paletteBytesPerColor, raw);
+            var isVignette = random.Next(2) == 0;
+
+            var expected = ReferenceDecode(gf, isVignette);
+            var actual = new GfReader(gf) { IsVignette = isVignette }.DecodeToRgba();
+
+            Assert.Equal(expected, actual);
+        }
+    }
+
+    private static byte[] BuildGf(
+        byte type,
+        int width,
+        int height,
+        byte channels,
+        byte repeatByte,
+        int pixelCount,
+        byte[] palette,
+        byte paletteBytesPerColor,
+        byte[] raw)
+    {
+        using var stream = new MemoryStream();
+        using var writer = new BinaryWriter(stream);
+        writer.Write((byte)0); // version
+        writer.Write(width);
+        writer.Write(height);
+        writer.Write(channels);
+        writer.Write(repeatByte);
+        writer.Write(paletteBytesPerColor > 0 ? (ushort)(palette.Length / paletteBytesPerColor) : (ushort)0);
+        writer.Write(paletteBytesPerColor);
+        writer.Write((byte)0);
+        writer.Write((byte)0);
+        writer.Write((byte)0);
+        writer.Write(0u);
+        writer.Write(pixelCount);
+        writer.Write(type);
+        writer.Write(palette);
+        writer.Write(raw);
+        return stream.ToArray();
+    }
+
+    /// <summary>
+    /// Byte-at-a-time decode of a Montreal GF texture: per-channel RLE planes, then a
+    /// per-pixel conversion for each format, without lookup tables or block copies.
+    /// </summary>
+    private static byte[] ReferenceDecode(byte[] gf, bool isVignette)
+    {
+        var width = BitConverter.ToInt32(gf, 1);
+        var height = BitConverter.ToInt32(gf, 5);
+        var channels = gf[9];
+        var repeatByte = gf[10];
+        var paletteLength = BitConverter.ToUInt16(gf, 11);
+        var paletteBytesPerColor = gf[13];
+        var pixelCount = BitConverter.ToInt32(gf, 21);
+        var type = gf[25];
+        var position = 26;
+
+        var palette = gf.AsSpan(position, paletteLength * paletteBytesPerColor).ToArray();
+        position += palette.Length;
+
+        var planes = new byte[pixelCount * channels];
+        for (var channel = 0; channel < channels; channel++)
+        {
+            var decoded = 0;
+            while (decoded < pixelCount && position < gf.Length)
+            {
+                var b = gf[position++];
+                if (b == repeatByte && position < gf.Length - 1)
+                {
+                    var value = gf[position++];
+                    var count = gf[position++];
+                    for (var i = 0; i < count && decoded < pixelCount; i++)
+                    {
+                        planes[channel * pixelCount + decoded++] = value;
+                    }
+                }
+                else
+                {
+                    planes[channel * pixelCount + decoded++] = b;
+                }
+            }
+        }
+
+        var mainPixels = width * height;
+        var result = new byte[mainPixels * 4];
+        for (var i = 0; i < mainPixels; i++)
+        {
+            var pixel = channels >= 2 ? (uint)(planes[i] | (planes[pixelCount + i] << 8)) : 0;
+            switch (type)
+            {
+                case 5:
+                    var offset = planes[i] * paletteBytesPerColor;
+                    if (offset + paletteBytesPerColor <= palette.Length)
+                    {
+                        result[i * 4 + 0] = palette[offset + 2];
+                        result[i * 4 + 1] = palette[offset + 1];
+                        result[i * 4 + 2] = palette[offset + 0];
+                        result[i * 4 + 3] = paletteBytesPerColor >= 4 ? palette[offset + 3] : (byte)255;
+                    }
+                    break;
+                case 10:
+                    var high5 = (pixel >> 11) & 0x1F;
+                    var low5 = pixel & 0x1F;
+                    result[i * 4 + 0] = (byte)((isVignette ? low5 : high5) * 255 / 31);
+                    result[i * 4 + 1] = (byte)(((pixel >> 5) & 0x3F) * 255 / 63);
+                    result[i * 4 + 2] = (byte)((isVignette ? high5 : low5) * 255 / 31);
+                    result[i * 4 + 3] = 255;
+                    break;
+                case 11:
+                    result[i * 4 + 0] = (byte)(((pixel >> 10) & 0x1F) * 255 / 31);
+                    result[i * 4 + 1] = (byte)(((pixel >> 5) & 0x1F) * 255 / 31);
+                    result[i * 4 + 2] = (byte)((pixel & 0x1F) * 255 / 31);
+                    result[i * 4 + 3] = (byte)(((pixel >> 15) & 0x1) * 255);
+                    break;
+                case 12:
+                    result[i * 4 + 0] = (byte)(((pixel >> 8) & 0xF) * 255 / 15);
+                    result[i * 4 + 1] = (byte)(((pixel >> 4) & 0xF) * 255 / 15);
+                    result[i * 4 + 2] = (byte)((pixel & 0xF) * 255 / 15);
+                    result[i * 4 + 3] = (byte)(((pixel >> 12) & 0xF) * 255 / 15);
+                    break;
+                default:
+                    result[i * 4 + 0] = 128;
+                    result[i * 4 + 1] = 128;
+                    result[i * 4 + 2] = 128;
+                    result[i * 4 + 3] = 255;
+                    break;
+            }
+        }
+
+        return result;
+    }
+}
@@ -0,0 +1,91 @@
+using Astrolabe.Core.FileFormats;
+using Xunit;
+
+namespace Astrolabe.Core.Tests;
+
+public sealed class MemoryContextTests
+{
+    [Fact]
+    public void GetBlockContaining_ResolvesAddressesAcrossBlocks()
+    {
+        var sna = new SnaReader(BuildSna(
+            (0x05, 0x01, 0x1000, new byte[0x100]),
+            (0x05, 0x02, 0x4000, new byte[0x20]),
+            (0x06, 0x01, 0x2000, new byte[0x80])));
+        var memory = new MemoryContext(sna, null);
+
+        Assert.Same(sna.GetBlock(0x05, 0x01), memory.GetBlockContaining(0x1000));
+        Assert.Same(sna.GetBlock(0x05, 0x01), memory.GetBlockContaining(0x10FF));
+        Assert.Same(sna.GetBlock(0x06, 0x01), memory.GetBlockContaining(0x2040));
+        Assert.Same(sna.GetBlock(0x05, 0x02), memory.GetBlockContaining(0x401F));
+    }
+
+    [Fact]
+    public void GetBlockContaining_ReturnsNullOutsideLoadedBlocks()
+    {
+        var sna = new SnaReader(BuildSna(
+            (0x05, 0x01, 0x1000, new byte[0x100]),
+            (0x06, 0x01, 0x2000, new byte[0x80])));
+        var memory = new MemoryContext(sna, null);
+
+        Assert.Null(memory.GetBlockContaining(0x0FFF));
+        Assert.Null(memory.GetBlockContaining(0x1100));
+        Assert.Null(memory.GetBlockContaining(0x2080));
+        Assert.Equal(0, memory.GetSpanAt(0x1100).Length);
+    }
+
+    [Fact]
+    public void GetBlockContaining_PrefersFirstBlockWhenRangesOverlap()
+    {
+        var sna = new SnaReader(BuildSna(
+            (0x05, 0x01, 0x1000, new byte[0x100]),
+            (0x06, 0x01, 0x0F00, new byte[0x200])));
+        var memory = new MemoryContext(sna, null);
+
+        Assert.Same(sna.GetBlock(0x05, 0x01), memory.GetBlockContaining(0x1010));
+        Assert.Same(sna.GetBlock(0x06, 0x01), memory.GetBlockContaining(0x0F10));
+    }
+
+    [Fact]
+    public void GetBlockContaining_SeesEmptyBlocksReplacedByMerge()
+    {
+        var sna = new SnaReader(BuildSna(
+            (0x05, 0x01, 0x1000, new byte[0x100]),
+            (0x06, 0x01, 0x2000, new byte[0x80])));
+        sna.Blocks[0] = new SnaBlock { Module = 0x05, Id = 0x01, BaseInMemory = 0x1000, Data = [] };
+        var memory = new MemoryContext(sna, null);
+        Assert.Null(memory.GetBlockContaining(0x1010));
+
+        // Merge swaps the empty block in place, leaving the block count unchanged
+        var other = new SnaReader(BuildSna((0x05, 0x01, 0x1000, new byte[0x100])));
+        sna.Merge(other);
+
+        Assert.Equal(2, sna.Blocks.Count);
+        Assert.Same(other.GetBlock(0x05, 0x01), memory.GetBlockContaining(0x1010));
+        Assert.Same(sna.GetBlock(0x06, 0x01), memory.GetBlockContaining(0x2040));
+    }
+
+    private static byte[] BuildSna(params (byte Module, byte Id, int Base, byte[] Data)[] blocks)
+    {
+        using var stream = new MemoryStream();
+        using var writer = new BinaryWriter(stream);
+        foreach (var (module, id, baseInMemory, data) in blocks)
+        {
+            writer.Write(module);
+            writer.Write(id);
+            writer.Write(baseInMemory);
+            writer.Write(0u); // unk2
+            writer.Write(0u); // unk3
+            writer.Write(0u); // maxPosMinus9
+            writer.Write((uint)data.Length);
+            writer.Write(0u); // not compressed
+            writer.Write((uint)data.Length);
+            writer.Write(0u);
+            writer.Write((uint)data.Length);
+            writer.Write(0u);
+            writer.Write(data);
+        }
+
+        return stream.ToArray();
+    }
+}
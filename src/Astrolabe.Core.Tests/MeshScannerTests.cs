@@ -0,0 +1,66 @@
+using Astrolabe.Core.FileFormats.Geometry;
+using Xunit;
+
+namespace Astrolabe.Core.Tests;
+
+public sealed class MeshScannerTests
+{
+    [Fact]
+    public void CountLeadingWithin_StopsAtFirstOutOfRangeFloat()
+    {
+        var specials = new[]
+        {
+            0f, -0f, 1f, -1f, 100000f, -100000f, MathF.BitIncrement(100000f), MathF.BitDecrement(100000f),
+            float.NaN, -float.NaN, float.PositiveInfinity, float.NegativeInfinity, float.Epsilon, 1e30f
+        };
+        var random = new Random(11);
+        for (var trial = 0; trial < 500; trial++)
+        {
+            var values = new float[random.Next(0, 40)];
+            for (var i = 0; i < values.Length; i++)
+            {
+                values[i] = random.Next(4) == 0
+                    ? specials[random.Next(specials.Length)]
+                    : (float)(random.NextDouble() * 200000 - 100000);
+            }
+
+            var bits = values.Select(BitConverter.SingleToUInt32Bits).ToArray();
+            var expected = Array.FindIndex(values, v => !(Math.Abs(v) <= 100000f));
+
+            Assert.Equal(expected < 0 ? values.Length : expected, MeshScanner.CountLeadingWithin(bits, 100000f));
+        }
+    }
+
+    [Fact]
+    public void FindHeaderCandidate_ReturnsFirstHeaderWithCountsInRange()
+    {
+        var random = new Random(5);
+        for (var trial = 0; trial < 500; trial++)
+        {
+            var end = random.Next(0, 60);
+            var words = new uint[end + 5];
+            for (var i = 0; i < words.Length; i++)
+            {
+                words[i] = random.Next(3) switch
+                {
+                    0 => (uint)random.Next(0, 12000),
+                    1 => (uint)random.Next(),
+                    _ => 0xFFFFFFFFu - (uint)random.Next(0, 4)
+                };
+            }
+
+            var start = random.Next(0, end + 1);
+            var expected = -1;
+            for (var i = start; i < end; i++)
+            {
+                if (words[i] is >= 3 and <= 10000 && words[i + 5] is >= 1 and <= 1000)
+                {
+                    expected = i;
+                    break;
+                }
+            }
+
+            Assert.Equal(expected, MeshScanner.FindHeaderCandidate(words, start, end));
+        }
+    }
+}
@@ -1822,4 +1822,71 @@ Kind = "collidezdxzone",
             }
         }
     }
+
+    [Fact]
+    public void SidecarAggregator_ReportsEveryTargetSharingADecodedPng()
+    {
+        var root = Path.Combine(Path.GetTempPath(), "astrolabe-side-tex-" + Guid.NewGuid().ToString("N"));
+        try
+        {
+            // 2x1 RGB565 texture; tex.gf and tex.GF both map to lvl/tex.png
+            var gf = new byte[] { 0, 2, 0, 0, 0, 1, 0, 0, 0, 2, 0xAA, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 10,
+                0xAA, 0x1F, 0x02, 0xF8, 0x07 };
+            var cntPath = Path.Combine(root, "Textures.cnt");
+            Directory.CreateDirectory(root);
+            File.WriteAllBytes(cntPath, BuildCnt("lvl", ["tex.gf", "tex.GF", "other.gf"], gf));
+
+            var outputRoot = Path.Combine(root, "out");
+            var uris = new List<string>();
+            var decoded = SidecarAggregator.TryDecodeReferencedTextures([cntPath], [], "lvl", outputRoot, uris.Add);
+
+            Assert.True(decoded);
+            Assert.Equal(
+                new[]
+                {
+                    "texture:/Gamedata/Textures/lvl/tex.png",
+                    "texture:/Gamedata/Textures/lvl/tex.png",
+                    "texture:/Gamedata/Textures/lvl/other.png"
+                },
+                uris.ToArray());
+            Assert.True(File.Exists(Path.Combine(outputRoot, "Gamedata", "Textures", "lvl", "tex.png")));
+        }
+        finally
+        {
+            if (Directory.Exists(root))
+            {
+                Directory.Delete(root, recursive: true);
+            }
+        }
+    }
+
+    private static byte[] BuildCnt(string directory, string[] fileNames, byte[] payload)
+    {
+        using var stream = new MemoryStream();
+        using var writer = new BinaryWriter(stream);
+        writer.Write(1); // directory count
+        writer.Write(fileNames.Length);
+        writer.Write((byte)0); // not XOR encrypted
+        writer.Write((byte)0); // no checksum
+        writer.Write((byte)0); // name key
+        writer.Write(directory.Length);
+        writer.Write(System.Text.Encoding.ASCII.GetBytes(directory));
+
+        // Every entry points at the same payload, stored once after the file table
+        var tableSize = fileNames.Sum(name => 8 + name.Length + 16);
+        var payloadPointer = (int)stream.Position + tableSize;
+        foreach (var name in fileNames)
+        {
+            writer.Write(0); // directory index
+            writer.Write(name.Length);
+            writer.Write(System.Text.Encoding.ASCII.GetBytes(name));
+            writer.Write(0u); // file XOR key
+            writer.Write(0u); // checksum
+            writer.Write(payloadPointer);
+            writer.Write(payload.Length);
+        }
+
+        writer.Write(payload);
+        return stream.ToArray();
+    }
 }
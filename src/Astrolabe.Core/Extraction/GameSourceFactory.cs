@@ -24,7 +24,8 @@ public static class GameSourceFactory
     }
 
     /// <summary>
-    /// Extracts files from a source to a directory.
+    /// Extracts files from a source to a directory, copying several files concurrently.
+    /// <paramref name="progress"/> may be reported from multiple threads.
     /// </summary>
     public static void ExtractFiles(
         IGameSource source,
@@ -36,7 +37,10 @@ public static class GameSourceFactory
         var totalFiles = files.Count;
         var extractedCount = 0;
 
-        foreach (var file in files)
+        // Each copy is a read and a write to disk, so several in flight keep the disk busy
+        // while others wait on I/O; the counter is shared, so completions may report out of order
+        var options = new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount };
+        Parallel.ForEach(files, options, file =>
         {
             var outputPath = Path.Combine(outputDirectory, file.Replace('/', Path.DirectorySeparatorChar));
             var outputDir = Path.GetDirectoryName(outputPath);
@@ -46,12 +50,29 @@ public static class GameSourceFactory
                 Directory.CreateDirectory(outputDir);
             }
 
-            using var sourceStream = source.OpenFile(file);
-            using var destStream = File.Create(outputPath);
-            sourceStream.CopyTo(destStream);
+            CopyFile(source, file, outputPath);
 
-            extractedCount++;
-            progress?.Report(new ExtractionProgress(file, extractedCount, totalFiles));
-        }
+            var completed = Interlocked.Increment(ref extractedCount);
+            progress?.Report(new ExtractionProgress(file, completed, totalFiles));
+        });
+    }
+
+    // Large enough that most game files copy in a handful of reads and writes
+    private const int CopyBufferSize = 1 << 20;
+
+    private static void CopyFile(IGameSource source, string file, string outputPath)
+    {
+        using var sourceStream = source.OpenFile(file);
+
+        // Writes already arrive in CopyBufferSize chunks, so skip the FileStream's own
+        // buffer, and reserve the full size up front when the source length is known
+        using var destStream = new FileStream(outputPath, new FileStreamOptions
+        {
+            Mode = FileMode.Create,
+            Access = FileAccess.Write,
+            BufferSize = 0,
+            PreallocationSize = sourceStream.CanSeek ? sourceStream.Length : 0
+        });
+        sourceStream.CopyTo(destStream, CopyBufferSize);
     }
 }
@@ -1,3 +1,5 @@
+using System.Runtime.InteropServices;
+
 namespace Astrolabe.Core.FileFormats.Audio;
 
 /// <summary>
@@ -14,7 +16,8 @@ public static class WavWriter
     /// <param name="channels">Number of channels (1 or 2)</param>
     public static void Write(string filePath, short[] samples, uint sampleRate, ushort channels)
     {
-        using var stream = File.Create(filePath);
+        using var stream = new FileStream(filePath, FileMode.Create, FileAccess.Write, FileShare.None,
+            bufferSize: 1 << 16);
         Write(stream, samples, sampleRate, channels);
     }
 
@@ -47,11 +50,8 @@ public static class WavWriter
         writer.Write("data"u8);
         writer.Write(dataSize);
 
-        // Write samples
-        foreach (short sample in samples)
-        {
-            writer.Write(sample);
-        }
+        // Write samples in one block; WAV is little-endian like the host layout
+        writer.Write(MemoryMarshal.AsBytes(samples.AsSpan()));
     }
 
     /// <summary>
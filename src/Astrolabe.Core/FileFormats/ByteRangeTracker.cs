@@ -80,6 +80,21 @@ public class ByteRangeTracker
     {
         var stats = new CoverageStats();
 
+        // Sort once so each block only visits the ranges that can overlap it.
+        // maxEnds[i] is the furthest End among sorted[0..i], which finds ranges
+        // that start before a block but still reach into it.
+        var sorted = _ranges.ToArray();
+        Array.Sort(sorted, (a, b) => a.Start.CompareTo(b.Start));
+        var starts = new int[sorted.Length];
+        var maxEnds = new int[sorted.Length];
+        int maxEnd = int.MinValue;
+        for (int i = 0; i < sorted.Length; i++)
+        {
+            starts[i] = sorted[i].Start;
+            maxEnd = Math.Max(maxEnd, sorted[i].End);
+            maxEnds[i] = maxEnd;
+        }
+
         foreach (var block in blocks)
         {
             if (block.Data == null) continue;
@@ -91,8 +106,12 @@ public class ByteRangeTracker
             // Create a bitmap of covered bytes for this block
             var covered = new bool[block.Data.Length];
 
-            foreach (var range in _ranges)
+            int first = LowerBound(maxEnds, blockStart + 1);
+            int last = LowerBound(starts, blockEnd);
+            for (int r = first; r < last; r++)
             {
+                var range = sorted[r];
+
                 // Check if range overlaps with this block
                 if (range.End <= blockStart || range.Start >= blockEnd)
                     continue;
@@ -156,6 +175,24 @@ public class ByteRangeTracker
         return stats;
     }
 
+    /// <summary>
+    /// Returns the first index whose value is at least <paramref name="value"/>
+    /// in an ascending array, or the array length if there is none.
+    /// </summary>
+    private static int LowerBound(int[] values, int value)
+    {
+        int lo = 0, hi = values.Length;
+        while (lo < hi)
+        {
+            int mid = lo + ((hi - lo) >> 1);
+            if (values[mid] < value)
+                lo = mid + 1;
+            else
+                hi = mid;
+        }
+        return lo;
+    }
+
     private static int MergeAndSum(IReadOnlyList<ByteRange> ranges)
     {
         if (ranges.Count == 0) return 0;
@@ -1,3 +1,6 @@
+using System.Buffers.Binary;
+using System.Numerics;
+using System.Runtime.InteropServices;
 using System.Text;
 
 namespace Astrolabe.Core.FileFormats;
@@ -57,37 +60,32 @@ public class CntReader
 
     private void Parse()
     {
-        using var reader = new BinaryReader(new MemoryStream(_data));
+        ReadOnlySpan<byte> data = _data;
 
         // Read header
-        DirectoryCount = reader.ReadInt32();
-        FileCount = reader.ReadInt32();
-        IsXorEncrypted = reader.ReadByte() != 0;
-        HasChecksum = reader.ReadByte() != 0;
-        XorKey = reader.ReadByte();
+        DirectoryCount = BinaryPrimitives.ReadInt32LittleEndian(data);
+        FileCount = BinaryPrimitives.ReadInt32LittleEndian(data[4..]);
+        IsXorEncrypted = data[8] != 0;
+        HasChecksum = data[9] != 0;
+        XorKey = data[10];
+        int pos = 11;
+
+        // Names use a single-byte key; repeated, it runs through the same XOR as file payloads
+        ReadOnlySpan<byte> nameKey = [XorKey, XorKey, XorKey, XorKey];
 
         // Read directories
         Directories = new string[DirectoryCount];
         for (int i = 0; i < DirectoryCount; i++)
         {
-            int stringLength = reader.ReadInt32();
-            var nameBytes = reader.ReadBytes(stringLength);
-
-            if (IsXorEncrypted)
-            {
-                for (int j = 0; j < nameBytes.Length; j++)
-                {
-                    nameBytes[j] ^= XorKey;
-                }
-            }
-
-            Directories[i] = Encoding.GetEncoding(1252).GetString(nameBytes).TrimEnd('\0');
+            int stringLength = BinaryPrimitives.ReadInt32LittleEndian(data[pos..]);
+            Directories[i] = DecodeName(data.Slice(pos + 4, stringLength), nameKey);
+            pos += 4 + stringLength;
         }
 
         // Read directory checksum if present
         if (HasChecksum && DirectoryCount > 0)
         {
-            reader.ReadByte(); // Checksum byte, we skip validation
+            pos++; // Checksum byte, we skip validation
         }
 
         // Read file entries
@@ -96,23 +94,20 @@ public class CntReader
         {
             var entry = new CntFileEntry();
 
-            entry.DirectoryIndex = reader.ReadInt32();
-            int filenameLength = reader.ReadInt32();
-            var filenameBytes = reader.ReadBytes(filenameLength);
-
-            if (IsXorEncrypted)
-            {
-                for (int j = 0; j < filenameBytes.Length; j++)
-                {
-                    filenameBytes[j] ^= XorKey;
-                }
-            }
-
-            entry.Filename = Encoding.GetEncoding(1252).GetString(filenameBytes).TrimEnd('\0');
-            entry.FileXorKey = reader.ReadBytes(4);
-            entry.Checksum = reader.ReadUInt32();
-            entry.FilePointer = reader.ReadInt32();
-            entry.FileSize = reader.ReadInt32();
+            // Fixed lead: directory index, filename length
+            var lead = data.Slice(pos, 8);
+            entry.DirectoryIndex = BinaryPrimitives.ReadInt32LittleEndian(lead);
+            int filenameLength = BinaryPrimitives.ReadInt32LittleEndian(lead[4..]);
+            entry.Filename = DecodeName(data.Slice(pos + 8, filenameLength), nameKey);
+            pos += 8 + filenameLength;
+
+            // Fixed tail: XOR key, checksum, file pointer, file size
+            var tail = data.Slice(pos, 16);
+            entry.FileXorKey = tail[..4].ToArray();
+            entry.Checksum = BinaryPrimitives.ReadUInt32LittleEndian(tail[4..]);
+            entry.FilePointer = BinaryPrimitives.ReadInt32LittleEndian(tail[8..]);
+            entry.FileSize = BinaryPrimitives.ReadInt32LittleEndian(tail[12..]);
+            pos += 16;
 
             // Build full path
             if (entry.DirectoryIndex >= 0 && entry.DirectoryIndex < Directories.Length)
@@ -128,23 +123,86 @@ public class CntReader
         }
     }
 
+    private string DecodeName(ReadOnlySpan<byte> encoded, ReadOnlySpan<byte> nameKey)
+    {
+        Span<byte> name = encoded.Length <= 256 ? stackalloc byte[encoded.Length] : new byte[encoded.Length];
+        if (IsXorEncrypted)
+        {
+            ApplyXorKey(encoded, name, nameKey);
+        }
+        else
+        {
+            encoded.CopyTo(name);
+        }
+
+        return Encoding.GetEncoding(1252).GetString(name).TrimEnd('\0');
+    }
+
     /// <summary>
     /// Extracts a file from the container.
     /// </summary>
     public byte[] ExtractFile(CntFileEntry entry)
     {
-        var data = new byte[entry.FileSize];
-        Array.Copy(_data, entry.FilePointer, data, 0, entry.FileSize);
+        var source = _data.AsSpan(entry.FilePointer, entry.FileSize);
 
-        // Decrypt with per-file XOR key
-        for (int i = 0; i < data.Length; i++)
+        // An all-zero key leaves the payload unchanged, so copy it out without the XOR pass
+        if (entry.FileXorKey.AsSpan().IndexOfAnyExcept((byte)0) < 0)
         {
-            data[i] ^= entry.FileXorKey[i % 4];
+            return source.ToArray();
         }
 
+        var data = new byte[entry.FileSize];
+
+        // Decrypt with per-file XOR key while copying out of the container
+        ApplyXorKey(source, data, entry.FileXorKey);
+
         return data;
     }
 
+    /// <summary>
+    /// XORs source into destination with a repeating 4-byte key, a vector and then a word at a time.
+    /// </summary>
+    private static void ApplyXorKey(ReadOnlySpan<byte> source, Span<byte> destination, ReadOnlySpan<byte> key)
+    {
+        int i = 0;
+        if (Vector.IsHardwareAccelerated && source.Length >= Vector<byte>.Count)
+        {
+            // Vector<byte>.Count is a multiple of 4, so the tiled key stays in phase
+            Span<byte> tiled = stackalloc byte[Vector<byte>.Count];
+            for (int k = 0; k < tiled.Length; k++)
+            {
+                tiled[k] = key[k & 3];
+            }
+            var keyVector = new Vector<byte>(tiled);
+
+            var sourceVectors = MemoryMarshal.Cast<byte, Vector<byte>>(source);
+            var destinationVectors = MemoryMarshal.Cast<byte, Vector<byte>>(destination);
+            for (int v = 0; v < sourceVectors.Length; v++)
+            {
+                destinationVectors[v] = sourceVectors[v] ^ keyVector;
+            }
+            i = sourceVectors.Length * Vector<byte>.Count;
+        }
+
+        // Whole words take the key as one uint; i is word-aligned here
+        var sourceWords = MemoryMarshal.Cast<byte, uint>(source[i..]);
+        if (sourceWords.Length > 0)
+        {
+            var destinationWords = MemoryMarshal.Cast<byte, uint>(destination[i..]);
+            uint keyWord = MemoryMarshal.Read<uint>(key);
+            for (int w = 0; w < sourceWords.Length; w++)
+            {
+                destinationWords[w] = sourceWords[w] ^ keyWord;
+            }
+            i += sourceWords.Length * sizeof(uint);
+        }
+
+        for (; i < source.Length; i++)
+        {
+            destination[i] = (byte)(source[i] ^ key[i & 3]);
+        }
+    }
+
     /// <summary>
     /// Extracts a file by name.
     /// </summary>
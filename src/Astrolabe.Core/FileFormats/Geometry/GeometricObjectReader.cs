@@ -1,4 +1,6 @@
+using System.Buffers.Binary;
 using System.Numerics;
+using System.Runtime.InteropServices;
 
 namespace Astrolabe.Core.FileFormats.Geometry;
 
@@ -27,14 +29,12 @@ public class GeometricObjectReader
     /// </summary>
     public static GeometricObjectReader? Read(byte[] data, int offset, int baseAddress = 0)
     {
-        if (offset < 0 || offset + 60 > data.Length)
+        // The structure is 64 bytes; anything shorter cannot hold the bounding sphere
+        if (offset < 0 || offset + 64 > data.Length)
             return null;
 
         var geo = new GeometricObjectReader();
-
-        using var ms = new MemoryStream(data);
-        ms.Position = offset;
-        using var reader = new BinaryReader(ms);
+        var header = data.AsSpan(offset, 64);
 
         // Montreal format:
         // uint32 num_vertices
@@ -49,24 +49,18 @@ public class GeometricObjectReader
         // float sphereRadius
         // float sphereX, sphereZ, sphereY
 
-        geo.NumVertices = reader.ReadUInt32();
-        geo.OffVertices = reader.ReadInt32();
-        geo.OffNormals = reader.ReadInt32();
-        geo.OffMaterials = reader.ReadInt32();
-        reader.ReadInt32(); // unknown
-        geo.NumElements = reader.ReadUInt32();
-        geo.OffElementTypes = reader.ReadInt32();
-        geo.OffElements = reader.ReadInt32();
-
-        reader.ReadInt32(); // unknown
-        reader.ReadInt32(); // unknown
-        reader.ReadInt32(); // unknown
-        reader.ReadInt32(); // unknown
-
-        geo.SphereRadius = reader.ReadSingle();
-        float sphereX = reader.ReadSingle();
-        float sphereZ = reader.ReadSingle();
-        float sphereY = reader.ReadSingle();
+        geo.NumVertices = BinaryPrimitives.ReadUInt32LittleEndian(header);
+        geo.OffVertices = BinaryPrimitives.ReadInt32LittleEndian(header[4..]);
+        geo.OffNormals = BinaryPrimitives.ReadInt32LittleEndian(header[8..]);
+        geo.OffMaterials = BinaryPrimitives.ReadInt32LittleEndian(header[12..]);
+        geo.NumElements = BinaryPrimitives.ReadUInt32LittleEndian(header[20..]);
+        geo.OffElementTypes = BinaryPrimitives.ReadInt32LittleEndian(header[24..]);
+        geo.OffElements = BinaryPrimitives.ReadInt32LittleEndian(header[28..]);
+
+        geo.SphereRadius = BinaryPrimitives.ReadSingleLittleEndian(header[48..]);
+        float sphereX = BinaryPrimitives.ReadSingleLittleEndian(header[52..]);
+        float sphereZ = BinaryPrimitives.ReadSingleLittleEndian(header[56..]);
+        float sphereY = BinaryPrimitives.ReadSingleLittleEndian(header[60..]);
         geo.SphereCenter = new Vector3(sphereX, sphereY, sphereZ);
 
         // Validate basic sanity
@@ -91,19 +85,7 @@ public class GeometricObjectReader
         if (vertexOffset < 0 || vertexOffset + NumVertices * 12 > data.Length)
             return false;
 
-        using var ms = new MemoryStream(data);
-        ms.Position = vertexOffset;
-        using var reader = new BinaryReader(ms);
-
-        Vertices = new Vector3[NumVertices];
-        for (int i = 0; i < NumVertices; i++)
-        {
-            float x = reader.ReadSingle();
-            float z = reader.ReadSingle();
-            float y = reader.ReadSingle();
-            Vertices[i] = new Vector3(x, y, z); // Note: Y and Z swapped for OpenSpace
-        }
-
+        Vertices = ReadSwizzled(data.AsSpan(vertexOffset), NumVertices);
         return true;
     }
 
@@ -115,19 +97,7 @@ public class GeometricObjectReader
         if (normalOffset < 0 || normalOffset + NumVertices * 12 > data.Length)
             return false;
 
-        using var ms = new MemoryStream(data);
-        ms.Position = normalOffset;
-        using var reader = new BinaryReader(ms);
-
-        Normals = new Vector3[NumVertices];
-        for (int i = 0; i < NumVertices; i++)
-        {
-            float x = reader.ReadSingle();
-            float z = reader.ReadSingle();
-            float y = reader.ReadSingle();
-            Normals[i] = new Vector3(x, y, z); // Note: Y and Z swapped for OpenSpace
-        }
-
+        Normals = ReadSwizzled(data.AsSpan(normalOffset), NumVertices);
         return true;
     }
 
@@ -139,16 +109,25 @@ public class GeometricObjectReader
         if (elementTypesOffset < 0 || elementTypesOffset + NumElements * 2 > data.Length)
             return false;
 
-        using var ms = new MemoryStream(data);
-        ms.Position = elementTypesOffset;
-        using var reader = new BinaryReader(ms);
+        // Reinterpret the whole run at once rather than decoding each value
+        ElementTypes = MemoryMarshal.Cast<byte, ushort>(data.AsSpan(elementTypesOffset, (int)NumElements * 2)).ToArray();
 
-        ElementTypes = new ushort[NumElements];
-        for (int i = 0; i < NumElements; i++)
+        return true;
+    }
+
+    /// <summary>
+    /// Reads (x, z, y) float triples into Vector3s with Y and Z swapped for OpenSpace.
+    /// </summary>
+    private static Vector3[] ReadSwizzled(ReadOnlySpan<byte> data, uint count)
+    {
+        // View the run as stored triples once, then only swap components
+        var stored = MemoryMarshal.Cast<byte, Vector3>(data[..(int)(count * 12)]);
+        var result = new Vector3[count];
+        for (int i = 0; i < result.Length; i++)
         {
-            ElementTypes[i] = reader.ReadUInt16();
+            var v = stored[i];
+            result[i] = new Vector3(v.X, v.Z, v.Y);
         }
-
-        return true;
+        return result;
     }
 }
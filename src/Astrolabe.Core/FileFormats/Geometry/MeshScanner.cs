@@ -1,4 +1,7 @@
+using System.Buffers.Binary;
 using System.Numerics;
+using System.Runtime.InteropServices;
+using System.Runtime.Intrinsics;
 using Astrolabe.Core.FileFormats.Materials;
 
 namespace Astrolabe.Core.FileFormats.Geometry;
@@ -25,12 +28,16 @@ public class MeshScanner
     /// </summary>
     public List<MeshData> ScanForMeshes()
     {
-        var meshes = new List<MeshData>();
+        var blocks = _memory.Sna.Blocks.Where(b => b.Data != null && b.Data.Length > 100).ToArray();
+
+        // Blocks scan independently; collect per block so output keeps block order
+        var blockMeshes = new List<MeshData>[blocks.Length];
+        Parallel.For(0, blocks.Length, i => blockMeshes[i] = ScanBlock(blocks[i]));
 
-        foreach (var block in _memory.Sna.Blocks.Where(b => b.Data != null && b.Data.Length > 100))
+        var meshes = new List<MeshData>(blockMeshes.Sum(m => m.Count));
+        foreach (var list in blockMeshes)
         {
-            var blockMeshes = ScanBlock(block);
-            meshes.AddRange(blockMeshes);
+            meshes.AddRange(list);
         }
 
         return meshes;
@@ -60,29 +67,38 @@ public class MeshScanner
         // float sphereZ              +56
         // float sphereY              +60
 
-        for (int offset = 0; offset < data.Length - 64; offset += 4)
+        var words = MemoryMarshal.Cast<byte, uint>(data.AsSpan());
+        int limit = data.Length - 64;
+        int wordLimit = limit > 0 ? (limit + 3) / 4 : 0;
+
+        for (int offset = 0; offset < limit; offset += 4)
         {
+            // Skip straight to the next word whose vertex and element counts are both in range
+            int candidate = FindHeaderCandidate(words, offset / 4, wordLimit);
+            if (candidate < 0)
+                break;
+            offset = candidate * 4;
+
             int memAddr = baseAddr + offset;
 
-            using var ms = new MemoryStream(data);
-            ms.Position = offset;
-            using var reader = new BinaryReader(ms);
+            // Candidates are word aligned, so the header fields index the block's
+            // word view directly instead of being re-read from bytes
+            var header = words.Slice(candidate, 8);
 
-            uint numVertices = reader.ReadUInt32();
+            uint numVertices = header[0];
             if (numVertices < 3 || numVertices > 10000)
                 continue;
 
-            int offVerts = reader.ReadInt32();
-            int offNormals = reader.ReadInt32();
-            int offMaterials = reader.ReadInt32();
-            reader.ReadInt32(); // skip
-            uint numElements = reader.ReadUInt32();
+            int offVerts = (int)header[1];
+            int offNormals = (int)header[2];
+            int offMaterials = (int)header[3];
+            uint numElements = header[5];
 
             if (numElements == 0 || numElements > 1000)
                 continue;
 
-            int offElementTypes = reader.ReadInt32();
-            int offElements = reader.ReadInt32();
+            int offElementTypes = (int)header[6];
+            int offElements = (int)header[7];
 
             // Validate pointers - check if they point to valid memory ranges
             // We relax RTB validation since not all pointers are in relocation tables
@@ -93,40 +109,40 @@ public class MeshScanner
             if (vertBlock == null || elemTypesBlock == null || elemsBlock == null)
                 continue;
 
-            // Read vertices
-            var vertices = ReadVertices(offVerts, numVertices);
+            // Read vertices (null unless the data is in range and has meaningful size),
+            // reusing the blocks just resolved instead of looking the addresses up again
+            var vertices = ReadVertices(SpanAt(vertBlock, offVerts), numVertices);
             if (vertices == null)
                 continue;
 
-            // Check for meaningful vertex data
-            if (!HasMeaningfulSize(vertices))
+            // Read element types (before normals, so rejected candidates skip that work)
+            var elementTypes = ReadElementTypes(SpanAt(elemTypesBlock, offElementTypes), numElements);
+            if (elementTypes == null)
                 continue;
 
             // Read normals
             var normals = ReadNormals(offNormals, numVertices);
 
-            // Read element types
-            var elementTypes = ReadElementTypes(offElementTypes, numElements);
-            if (elementTypes == null)
-                continue;
-
             // Read elements and extract triangles/UVs per submesh
             var subMeshes = new List<SubMeshData>();
-            var allTriangles = new List<int>();
-            var allUVs = new List<Vector2>();
-            var allUVIndices = new List<int>();
+            var elements = new List<ElementData>();
             string? textureName = null;
 
+            // The element pointer array lives in the block already resolved above, so
+            // slice it once rather than looking each pointer's address up again
+            var elementPointers = SpanAt(elemsBlock, offElements);
+
             for (int i = 0; i < numElements; i++)
             {
                 if (elementTypes[i] == 1) // Material/Triangles element
                 {
-                    // Read element pointer
-                    int elemPtrOffset = offElements + (i * 4);
-                    var elemReader = _memory.GetReaderAt(elemPtrOffset);
-                    if (elemReader == null) continue;
+                    // Read element pointer, falling back to a full lookup past the block end
+                    var elemPtr = (i + 1) * 4 <= elementPointers.Length
+                        ? elementPointers[(i * 4)..]
+                        : _memory.GetSpanAt(offElements + (i * 4));
+                    if (elemPtr.Length < 4) continue;
 
-                    int elemAddr = elemReader.ReadInt32();
+                    int elemAddr = BinaryPrimitives.ReadInt32LittleEndian(elemPtr);
                     var element = ReadElementTriangles(elemAddr, numVertices);
                     if (element != null)
                     {
@@ -149,19 +165,8 @@ public class MeshScanner
 
                         subMeshes.Add(subMesh);
 
-                        // Also accumulate for legacy single-mesh support
-                        allTriangles.AddRange(element.Triangles);
-
-                        if (element.UVs != null && element.UVMapping != null)
-                        {
-                            int uvOffset = allUVs.Count;
-                            allUVs.AddRange(element.UVs);
-
-                            foreach (var uvIdx in element.UVMapping)
-                            {
-                                allUVIndices.Add(uvIdx + uvOffset);
-                            }
-                        }
+                        // Also keep for legacy single-mesh support
+                        elements.Add(element);
 
                         if (textureName == null && element.TextureName != null)
                         {
@@ -171,15 +176,17 @@ public class MeshScanner
                 }
             }
 
+            var (allTriangles, allUVs, allUVIndices) = CombineElements(elements);
+
             var mesh = new MeshData
             {
                 Name = $"Mesh_{block.Module:X2}_{block.Id:X2}_{offset:X}",
                 Vertices = vertices,
                 Normals = normals,
                 SubMeshes = subMeshes,
-                Indices = allTriangles.Count > 0 ? allTriangles.ToArray() : null,
-                UVs = allUVs.Count > 0 ? allUVs.ToArray() : null,
-                UVIndices = allUVIndices.Count > 0 ? allUVIndices.ToArray() : null,
+                Indices = allTriangles,
+                UVs = allUVs,
+                UVIndices = allUVIndices,
                 TextureName = textureName,
                 SourceBlock = block,
                 SourceOffset = offset,
@@ -194,82 +201,134 @@ public class MeshScanner
         return meshes;
     }
 
-    private Vector3[]? ReadVertices(int address, uint count)
+    /// <summary>
+    /// Finds the first header start in [start, end) whose num_vertices (+0) is in
+    /// 3..10000 and num_elements (+20) is in 1..1000, or -1. Most of a block fails
+    /// these tests, so they run a vector of header starts at a time before any
+    /// header is decoded. Each candidate's element count is read five words on, so
+    /// words must hold at least end + 5 entries.
+    /// </summary>
+    public static int FindHeaderCandidate(ReadOnlySpan<uint> words, int start, int end)
     {
-        var reader = _memory.GetReaderAt(address);
-        if (reader == null) return null;
-
-        try
+        const uint MinVertices = 3;
+        const uint MaxVertices = 10000;
+        const uint MinElements = 1;
+        const uint MaxElements = 1000;
+        const int ElementsWord = 5;
+
+        int i = start;
+        if (Vector.IsHardwareAccelerated)
         {
-            var vertices = new Vector3[count];
-            for (int i = 0; i < count; i++)
+            var minVertices = new Vector<uint>(MinVertices);
+            var vertexRange = new Vector<uint>(MaxVertices - MinVertices);
+            var minElements = new Vector<uint>(MinElements);
+            var elementRange = new Vector<uint>(MaxElements - MinElements);
+            for (; i <= end - Vector<uint>.Count; i += Vector<uint>.Count)
             {
-                float x = reader.ReadSingle();
-                float z = reader.ReadSingle();
-                float y = reader.ReadSingle();
-
-                if (float.IsNaN(x) || float.IsNaN(y) || float.IsNaN(z) ||
-                    float.IsInfinity(x) || float.IsInfinity(y) || float.IsInfinity(z) ||
-                    Math.Abs(x) > 100000 || Math.Abs(y) > 100000 || Math.Abs(z) > 100000)
-                {
-                    return null;
-                }
-
-                vertices[i] = new Vector3(x, y, z);
+                // (w - min) wraps below min, so one unsigned compare covers both bounds
+                var vertices = new Vector<uint>(words.Slice(i, Vector<uint>.Count));
+                var elements = new Vector<uint>(words.Slice(i + ElementsWord, Vector<uint>.Count));
+                var valid = Vector.LessThanOrEqual(vertices - minVertices, vertexRange) &
+                            Vector.LessThanOrEqual(elements - minElements, elementRange);
+                if (valid != Vector<uint>.Zero)
+                    break;
             }
-            return vertices;
         }
-        catch
+
+        for (; i < end; i++)
         {
-            return null;
+            if (words[i] - MinVertices <= MaxVertices - MinVertices &&
+                words[i + ElementsWord] - MinElements <= MaxElements - MinElements)
+                return i;
         }
+        return -1;
     }
 
-    private Vector3[]? ReadNormals(int address, uint count)
+    /// <summary>
+    /// Concatenates element triangles and UVs into the legacy whole-mesh arrays,
+    /// sized up front. UV indices are rebased onto the combined UV array.
+    /// </summary>
+    private static (int[]? Triangles, Vector2[]? UVs, int[]? UVIndices) CombineElements(List<ElementData> elements)
     {
-        var reader = _memory.GetReaderAt(address);
-        if (reader == null) return null;
-
-        try
+        int triangleCount = 0, uvCount = 0, uvIndexCount = 0;
+        foreach (var element in elements)
         {
-            var normals = new Vector3[count];
-            for (int i = 0; i < count; i++)
+            triangleCount += element.Triangles.Length;
+            if (element.UVs != null && element.UVMapping != null)
             {
-                float x = reader.ReadSingle();
-                float z = reader.ReadSingle();
-                float y = reader.ReadSingle();
+                uvCount += element.UVs.Length;
+                uvIndexCount += element.UVMapping.Length;
+            }
+        }
 
-                if (float.IsNaN(x) || float.IsNaN(y) || float.IsNaN(z))
-                    return null;
+        var triangles = new int[triangleCount];
+        var uvs = new Vector2[uvCount];
+        var uvIndices = new int[uvIndexCount];
+        int t = 0, u = 0, m = 0;
+        foreach (var element in elements)
+        {
+            element.Triangles.CopyTo(triangles, t);
+            t += element.Triangles.Length;
 
-                normals[i] = new Vector3(x, y, z);
+            if (element.UVs != null && element.UVMapping != null)
+            {
+                AddOffset(element.UVMapping, u, uvIndices.AsSpan(m));
+                m += element.UVMapping.Length;
+                element.UVs.CopyTo(uvs, u);
+                u += element.UVs.Length;
             }
-            return normals;
         }
-        catch
-        {
+
+        return (
+            triangleCount > 0 ? triangles : null,
+            uvCount > 0 ? uvs : null,
+            uvIndexCount > 0 ? uvIndices : null);
+    }
+
+    private static Vector3[]? ReadVertices(ReadOnlySpan<byte> bytes, uint count)
+    {
+        if (bytes.Length < count * 12) return null;
+
+        // Validate the whole run at once, then swizzle (x, z, y) into Vector3
+        var floats = MemoryMarshal.Cast<byte, float>(bytes[..(int)(count * 12)]);
+        if (!IsPlausibleVertexRun(floats, 100000f))
             return null;
-        }
+
+        return Swizzle(MemoryMarshal.Cast<float, Vector3>(floats));
     }
 
-    private ushort[]? ReadElementTypes(int address, uint count)
+    private Vector3[]? ReadNormals(int address, uint count)
     {
-        var reader = _memory.GetReaderAt(address);
-        if (reader == null) return null;
+        var bytes = _memory.GetSpanAt(address);
+        if (bytes.Length < count * 12) return null;
 
-        try
-        {
-            var types = new ushort[count];
-            for (int i = 0; i < count; i++)
-            {
-                types[i] = reader.ReadUInt16();
-            }
-            return types;
-        }
-        catch
-        {
+        var bits = MemoryMarshal.Cast<byte, uint>(bytes[..(int)(count * 12)]);
+        if (AnyNaN(bits))
             return null;
+
+        return Swizzle(MemoryMarshal.Cast<uint, Vector3>(bits));
+    }
+
+    /// <summary>
+    /// Copies stored (x, z, y) triples into Vector3s with Y and Z swapped,
+    /// reading each triple as one vector instead of three indexed floats.
+    /// </summary>
+    private static Vector3[] Swizzle(ReadOnlySpan<Vector3> stored)
+    {
+        var result = new Vector3[stored.Length];
+        for (int i = 0; i < result.Length; i++)
+        {
+            var v = stored[i];
+            result[i] = new Vector3(v.X, v.Z, v.Y);
         }
+        return result;
+    }
+
+    private static ushort[]? ReadElementTypes(ReadOnlySpan<byte> bytes, uint count)
+    {
+        if (bytes.Length < count * 2) return null;
+
+        return MemoryMarshal.Cast<byte, ushort>(bytes[..(int)(count * 2)]).ToArray();
     }
 
     private ElementData? ReadElementTriangles(int address, uint numVertices)
@@ -288,51 +347,49 @@ public class MeshScanner
         // uint16 parallelBox         +34
         // uint32 (skip)              +36
 
-        var reader = _memory.GetReaderAt(address);
-        if (reader == null) return null;
+        var header = _memory.GetSpanAt(address);
+        if (header.Length < 24) return null;
 
         try
         {
-            int offMaterial = reader.ReadInt32();
-            ushort numTriangles = reader.ReadUInt16();
-            ushort numUvs = reader.ReadUInt16();
-            int offTriangles = reader.ReadInt32();
-            int offMappingUvs = reader.ReadInt32();
-            int offNormals = reader.ReadInt32();
-            int offUvs = reader.ReadInt32();
+            int offMaterial = BinaryPrimitives.ReadInt32LittleEndian(header);
+            ushort numTriangles = BinaryPrimitives.ReadUInt16LittleEndian(header[4..]);
+            ushort numUvs = BinaryPrimitives.ReadUInt16LittleEndian(header[6..]);
+            int offTriangles = BinaryPrimitives.ReadInt32LittleEndian(header[8..]);
+            int offMappingUvs = BinaryPrimitives.ReadInt32LittleEndian(header[12..]);
+            int offUvs = BinaryPrimitives.ReadInt32LittleEndian(header[20..]);
 
             if (numTriangles == 0 || numTriangles > 10000)
                 return null;
 
             // Read triangle indices
-            var triReader = _memory.GetReaderAt(offTriangles);
-            if (triReader == null) return null;
+            var triBytes = _memory.GetSpanAt(offTriangles);
+            if (triBytes.Length < numTriangles * 6) return null;
 
-            var triangles = new int[numTriangles * 3];
-            for (int i = 0; i < numTriangles * 3; i++)
-            {
-                short index = triReader.ReadInt16();
-                if (index < 0 || index >= numVertices)
-                    return null; // Invalid index
-                triangles[i] = index;
-            }
+            var indices = MemoryMarshal.Cast<byte, ushort>(triBytes[..(numTriangles * 6)]);
+            if (!AllBelow(indices, (ushort)Math.Min(numVertices, short.MaxValue + 1u)))
+                return null; // Invalid index
+
+            var triangles = new int[indices.Length];
+            WidenIndices(indices, triangles);
 
             var element = new ElementData { Triangles = triangles };
 
             // Read UVs
             if (numUvs > 0 && offUvs != 0)
             {
-                var uvReader = _memory.GetReaderAt(offUvs);
-                if (uvReader != null)
+                var uvBytes = _memory.GetSpanAt(offUvs);
+                if (!uvBytes.IsEmpty)
                 {
+                    if (uvBytes.Length < numUvs * 8) return null;
+
+                    var uvs = MemoryMarshal.Cast<byte, Vector2>(uvBytes[..(numUvs * 8)]);
                     element.UVs = new Vector2[numUvs];
                     for (int i = 0; i < numUvs; i++)
                     {
-                        float u = uvReader.ReadSingle();
-                        float v = uvReader.ReadSingle();
                         // Flip V coordinate because we flip textures vertically on export
                         // (game stores textures upside-down for GPU, we export right-side up)
-                        element.UVs[i] = new Vector2(u, 1.0f - v);
+                        element.UVs[i] = new Vector2(uvs[i].X, 1.0f - uvs[i].Y);
                     }
                 }
             }
@@ -340,13 +397,16 @@ public class MeshScanner
             // Read UV mapping (maps each triangle vertex to a UV index)
             if (offMappingUvs != 0 && numTriangles > 0)
             {
-                var uvMapReader = _memory.GetReaderAt(offMappingUvs);
-                if (uvMapReader != null)
+                var mapBytes = _memory.GetSpanAt(offMappingUvs);
+                if (!mapBytes.IsEmpty)
                 {
-                    element.UVMapping = new int[numTriangles * 3];
-                    for (int i = 0; i < numTriangles * 3; i++)
+                    if (mapBytes.Length < numTriangles * 6) return null;
+
+                    var mapping = MemoryMarshal.Cast<byte, short>(mapBytes[..(numTriangles * 6)]);
+                    element.UVMapping = new int[mapping.Length];
+                    for (int i = 0; i < mapping.Length; i++)
                     {
-                        element.UVMapping[i] = uvMapReader.ReadInt16();
+                        element.UVMapping[i] = mapping[i];
                     }
                 }
             }
@@ -379,46 +439,188 @@ public class MeshScanner
         }
     }
 
-    private SnaBlock? FindBlockContaining(int address)
+    /// <summary>
+    /// Tests raw float bits for NaN: exponent all ones with a non-zero mantissa,
+    /// i.e. the magnitude bits compare above the infinity pattern.
+    /// </summary>
+    private static bool AnyNaN(ReadOnlySpan<uint> bits)
     {
-        foreach (var block in _memory.Sna.Blocks)
+        const uint MagnitudeMask = 0x7FFFFFFF;
+        const uint Infinity = 0x7F800000;
+
+        int i = 0;
+        if (Vector.IsHardwareAccelerated && bits.Length >= Vector<uint>.Count)
         {
-            if (block.Data == null) continue;
-            int endAddr = block.BaseInMemory + block.Data.Length;
-            if (address >= block.BaseInMemory && address < endAddr)
-                return block;
+            var mask = new Vector<uint>(MagnitudeMask);
+            var infinity = new Vector<uint>(Infinity);
+            var vectors = MemoryMarshal.Cast<uint, Vector<uint>>(bits);
+            foreach (var v in vectors)
+            {
+                if (Vector.GreaterThanAny(v & mask, infinity))
+                    return true;
+            }
+            i = vectors.Length * Vector<uint>.Count;
         }
-        return null;
+
+        for (; i < bits.Length; i++)
+        {
+            if ((bits[i] & MagnitudeMask) > Infinity)
+                return true;
+        }
+        return false;
     }
 
-    private static bool HasMeaningfulSize(Vector3[] vertices)
+    /// <summary>
+    /// Counts the leading float bit patterns with |value| &lt;= limit, for a finite,
+    /// non-negative limit. With the sign cleared, IEEE-754 bit patterns order like
+    /// the magnitudes they encode, and infinity and NaN sit above every finite
+    /// limit, so one unsigned compare per lane covers all three.
+    /// </summary>
+    public static int CountLeadingWithin(ReadOnlySpan<uint> bits, float limit)
     {
-        if (vertices.Length < 3) return false;
+        const uint MagnitudeMask = 0x7FFFFFFF;
+        uint limitBits = BitConverter.SingleToUInt32Bits(limit);
 
-        float minX = float.MaxValue, maxX = float.MinValue;
-        float minY = float.MaxValue, maxY = float.MinValue;
-        float minZ = float.MaxValue, maxZ = float.MinValue;
+        int i = 0;
+        if (Vector.IsHardwareAccelerated)
+        {
+            var mask = new Vector<uint>(MagnitudeMask);
+            var limits = new Vector<uint>(limitBits);
+            for (; i <= bits.Length - Vector<uint>.Count; i += Vector<uint>.Count)
+            {
+                var v = new Vector<uint>(bits.Slice(i, Vector<uint>.Count));
+                if (Vector.GreaterThanAny(v & mask, limits))
+                    break;
+            }
+        }
 
-        foreach (var v in vertices)
+        for (; i < bits.Length; i++)
         {
-            minX = Math.Min(minX, v.X); maxX = Math.Max(maxX, v.X);
-            minY = Math.Min(minY, v.Y); maxY = Math.Max(maxY, v.Y);
-            minZ = Math.Min(minZ, v.Z); maxZ = Math.Max(maxZ, v.Z);
+            if ((bits[i] & MagnitudeMask) > limitBits)
+                break;
         }
+        return i;
+    }
 
-        float sizeX = maxX - minX;
-        float sizeY = maxY - minY;
-        float sizeZ = maxZ - minZ;
+    /// <summary>
+    /// Checks that every index is below the given count. Indices are stored as
+    /// int16, so negative values read as ushort land at 32768 and above.
+    /// </summary>
+    private static bool AllBelow(ReadOnlySpan<ushort> indices, ushort count)
+    {
+        int i = 0;
+        if (Vector.IsHardwareAccelerated && indices.Length >= Vector<ushort>.Count)
+        {
+            var limits = new Vector<ushort>(count);
+            var vectors = MemoryMarshal.Cast<ushort, Vector<ushort>>(indices);
+            foreach (var v in vectors)
+            {
+                if (!Vector.LessThanAll(v, limits))
+                    return false;
+            }
+            i = vectors.Length * Vector<ushort>.Count;
+        }
+
+        // SWAR over four 16-bit lanes per ulong: adding (0x8000 - count) sets a
+        // lane's top bit exactly when it is >= count. Lanes already >= 0x8000 are
+        // caught by the OR, so any carry they leak into a neighbour is harmless.
+        var lanes = MemoryMarshal.Cast<ushort, ulong>(indices[i..]);
+        ulong bias = 0x0001_0001_0001_0001UL * (ulong)(0x8000 - count);
+        foreach (var packed in lanes)
+        {
+            if (((packed | (packed + bias)) & 0x8000_8000_8000_8000UL) != 0)
+                return false;
+        }
+        i += lanes.Length * 4;
+
+        for (; i < indices.Length; i++)
+        {
+            if (indices[i] >= count)
+                return false;
+        }
+        return true;
+    }
+
+    /// <summary>
+    /// Zero-extends validated uint16 indices into the int index buffer.
+    /// </summary>
+    internal static void WidenIndices(ReadOnlySpan<ushort> source, Span<int> destination)
+    {
+        int i = 0;
+        if (Vector.IsHardwareAccelerated && source.Length >= Vector<ushort>.Count)
+        {
+            var vectors = MemoryMarshal.Cast<ushort, Vector<ushort>>(source);
+            var output = MemoryMarshal.Cast<int, Vector<uint>>(destination);
+            for (int v = 0; v < vectors.Length; v++)
+            {
+                Vector.Widen(vectors[v], out output[v * 2], out output[v * 2 + 1]);
+            }
+            i = vectors.Length * Vector<ushort>.Count;
+        }
+
+        for (; i < source.Length; i++)
+        {
+            destination[i] = source[i];
+        }
+    }
+
+    /// <summary>
+    /// Writes source[i] + offset to destination[i], rebasing a run of indices
+    /// onto a combined buffer a vector at a time.
+    /// </summary>
+    internal static void AddOffset(ReadOnlySpan<int> source, int offset, Span<int> destination)
+    {
+        int i = 0;
+        if (Vector.IsHardwareAccelerated && source.Length >= Vector<int>.Count)
+        {
+            var offsets = new Vector<int>(offset);
+            var vectors = MemoryMarshal.Cast<int, Vector<int>>(source);
+            var output = MemoryMarshal.Cast<int, Vector<int>>(destination);
+            for (int v = 0; v < vectors.Length; v++)
+            {
+                output[v] = vectors[v] + offsets;
+            }
+            i = vectors.Length * Vector<int>.Count;
+        }
+
+        for (; i < source.Length; i++)
+        {
+            destination[i] = source[i] + offset;
+        }
+    }
+
+    private SnaBlock? FindBlockContaining(int address) => _memory.GetBlockContaining(address);
+
+    private static ReadOnlySpan<byte> SpanAt(SnaBlock block, int address) =>
+        block.Data.AsSpan(address - block.BaseInMemory);
+
+    /// <summary>
+    /// Checks raw vertex floats: every component must be finite with
+    /// |value| &lt;= limit, and the bounding box must be non-trivial, so rejected
+    /// candidates never allocate a vertex array. The range test runs first on
+    /// the raw bits, where most garbage candidates fail cheaply.
+    /// </summary>
+    private static bool IsPlausibleVertexRun(ReadOnlySpan<float> floats, float limit)
+    {
+        var vertices = MemoryMarshal.Cast<float, Vector3>(floats);
+        if (vertices.Length < 3) return false;
+
+        var bits = MemoryMarshal.Cast<float, uint>(floats);
+        if (CountLeadingWithin(bits, limit) != bits.Length)
+            return false;
+
+        var (min, max) = MeshData.GetBounds(vertices);
+        var size = max - min;
 
         // At least some dimension should be meaningful
-        return sizeX > 0.01f || sizeY > 0.01f || sizeZ > 0.01f;
+        return size.X > 0.01f || size.Y > 0.01f || size.Z > 0.01f;
     }
 }
 
 /// <summary>
 /// Represents extracted mesh data with multiple submeshes.
 /// </summary>
-public class MeshData
+public sealed class MeshData
 {
     public string Name { get; set; } = "";
     public int VirtualAddress { get; set; }
@@ -444,12 +646,73 @@ public class MeshData
     public int SourceOffset { get; set; }
     public uint NumVertices { get; set; }
     public uint NumElements { get; set; }
+
+    /// <summary>
+    /// Computes the axis-aligned bounds of all vertices in a single pass.
+    /// </summary>
+    public (Vector3 Min, Vector3 Max) GetBounds() => GetBounds(Vertices);
+
+    /// <summary>
+    /// Computes the axis-aligned bounds of a vertex run in a single pass. Four
+    /// packed vertices fill exactly three 128-bit vectors, so the run is reduced
+    /// with three min/max accumulators whose lanes are folded back per axis.
+    /// </summary>
+    public static (Vector3 Min, Vector3 Max) GetBounds(ReadOnlySpan<Vector3> vertices)
+    {
+        var min = new Vector3(float.MaxValue);
+        var max = new Vector3(float.MinValue);
+
+        int i = 0;
+        if (Vector128.IsHardwareAccelerated && vertices.Length >= 4)
+        {
+            ref float start = ref MemoryMarshal.GetReference(MemoryMarshal.Cast<Vector3, float>(vertices));
+            var min0 = Vector128.Create(float.MaxValue);
+            var min1 = min0;
+            var min2 = min0;
+            var max0 = Vector128.Create(float.MinValue);
+            var max1 = max0;
+            var max2 = max0;
+
+            int quads = vertices.Length / 4;
+            for (int q = 0; q < quads; q++)
+            {
+                nuint f = (nuint)q * 12;
+                var a = Vector128.LoadUnsafe(ref start, f);
+                var b = Vector128.LoadUnsafe(ref start, f + 4);
+                var c = Vector128.LoadUnsafe(ref start, f + 8);
+                min0 = Vector128.Min(min0, a);
+                min1 = Vector128.Min(min1, b);
+                min2 = Vector128.Min(min2, c);
+                max0 = Vector128.Max(max0, a);
+                max1 = Vector128.Max(max1, b);
+                max2 = Vector128.Max(max2, c);
+            }
+            i = quads * 4;
+
+            // Lanes hold (x0 y0 z0 x1) (y1 z1 x2 y2) (z2 x3 y3 z3)
+            min = Vector3.Min(min, new Vector3(min0[0], min0[1], min0[2]));
+            min = Vector3.Min(min, new Vector3(min0[3], min1[0], min1[1]));
+            min = Vector3.Min(min, new Vector3(min1[2], min1[3], min2[0]));
+            min = Vector3.Min(min, new Vector3(min2[1], min2[2], min2[3]));
+            max = Vector3.Max(max, new Vector3(max0[0], max0[1], max0[2]));
+            max = Vector3.Max(max, new Vector3(max0[3], max1[0], max1[1]));
+            max = Vector3.Max(max, new Vector3(max1[2], max1[3], max2[0]));
+            max = Vector3.Max(max, new Vector3(max2[1], max2[2], max2[3]));
+        }
+
+        for (; i < vertices.Length; i++)
+        {
+            min = Vector3.Min(min, vertices[i]);
+            max = Vector3.Max(max, vertices[i]);
+        }
+        return (min, max);
+    }
 }
 
 /// <summary>
 /// A submesh with its own triangles, UVs, and texture.
 /// </summary>
-public class SubMeshData
+public sealed class SubMeshData
 {
     public int[] Triangles { get; set; } = [];
     public Vector2[] UVs { get; set; } = [];
@@ -476,7 +739,7 @@ public class SubMeshData
 /// <summary>
 /// Data from a single element (submesh).
 /// </summary>
-public class ElementData
+public sealed class ElementData
 {
     public int[] Triangles { get; set; } = [];
     public Vector2[]? UVs { get; set; }
@@ -1,6 +1,9 @@
+using System.Buffers;
+using System.Buffers.Binary;
+using System.Runtime.InteropServices;
 using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.Formats.Png;
 using SixLabors.ImageSharp.PixelFormats;
-using SixLabors.ImageSharp.Processing;
 
 namespace Astrolabe.Core.FileFormats;
 
@@ -19,7 +22,11 @@ public class GfReader
     public int PixelCount { get; private set; }
     public GfFormat Format { get; private set; }
     public byte[]? Palette { get; private set; }
-    public byte[] RawPixelData { get; private set; } = [];
+
+    /// <summary>
+    /// RLE-encoded pixel data as a view over the texture bytes, without a copy.
+    /// </summary>
+    public ReadOnlyMemory<byte> RawPixelData { get; private set; }
 
     /// <summary>
     /// If true, treat as a vignette (direct display image) using BGR channel order and no flip.
@@ -28,6 +35,11 @@ public class GfReader
     /// </summary>
     public bool IsVignette { get; set; }
 
+    private const int HeaderSize = 26;
+
+    // Extraction writes many textures in one run, so trade a little file size for much faster deflate
+    private static readonly PngEncoder PngEncoder = new() { CompressionLevel = PngCompressionLevel.BestSpeed };
+
     private readonly byte[] _data;
 
     public GfReader(byte[] data)
@@ -38,29 +50,26 @@ public class GfReader
 
     private void Parse()
     {
-        using var reader = new BinaryReader(new MemoryStream(_data));
+        ReadOnlySpan<byte> data = _data;
 
-        // Montreal variant header
-        Version = reader.ReadByte();
-        Width = reader.ReadInt32();
-        Height = reader.ReadInt32();
-        Channels = reader.ReadByte();
+        // Montreal variant header: one fixed 26-byte record
+        var header = data[..HeaderSize];
+        Version = header[0];
+        Width = BinaryPrimitives.ReadInt32LittleEndian(header[1..]);
+        Height = BinaryPrimitives.ReadInt32LittleEndian(header[5..]);
+        Channels = header[9];
 
         // Montreal does NOT have mipmaps byte - it's calculated from PixelCount later
-        RepeatByte = reader.ReadByte();
+        RepeatByte = header[10];
 
-        PaletteLength = reader.ReadUInt16();
-        PaletteBytesPerColor = reader.ReadByte();
+        PaletteLength = BinaryPrimitives.ReadUInt16LittleEndian(header[11..]);
+        PaletteBytesPerColor = header[13];
 
-        // Unknown bytes
-        reader.ReadByte(); // byte_0F
-        reader.ReadByte(); // byte_10
-        reader.ReadByte(); // byte_11
-        reader.ReadUInt32(); // uint_12
+        // Unknown bytes: byte_0F, byte_10, byte_11 at 14..16, uint_12 at 17..20
 
-        PixelCount = reader.ReadInt32();
+        PixelCount = BinaryPrimitives.ReadInt32LittleEndian(header[21..]);
 
-        byte montrealType = reader.ReadByte();
+        byte montrealType = header[25];
         Format = montrealType switch
         {
             5 => GfFormat.Palette,
@@ -70,223 +79,256 @@ public class GfReader
             _ => GfFormat.Unknown
         };
 
+        var body = data[HeaderSize..];
+
         // Read palette if present
         if (PaletteLength > 0 && PaletteBytesPerColor > 0)
         {
-            Palette = reader.ReadBytes(PaletteLength * PaletteBytesPerColor);
+            var palette = body[..Math.Min(PaletteLength * PaletteBytesPerColor, body.Length)];
+            Palette = palette.ToArray();
+            body = body[palette.Length..];
         }
 
-        // Read remaining RLE-encoded pixel data
-        int remaining = (int)(reader.BaseStream.Length - reader.BaseStream.Position);
-        RawPixelData = reader.ReadBytes(remaining);
+        // Remaining RLE-encoded pixel data, kept as a view over the texture bytes
+        RawPixelData = _data.AsMemory(_data.Length - body.Length);
     }
 
     /// <summary>
-    /// Decodes the RLE-encoded pixel data.
+    /// Decodes the RLE-encoded pixel data into a zeroed buffer of PixelCount * Channels bytes.
     /// </summary>
-    private byte[] DecodeRle()
+    private void DecodeRle(Span<byte> result)
     {
-        int expectedSize = PixelCount * Channels;
-        var result = new byte[expectedSize];
-
-        using var reader = new BinaryReader(new MemoryStream(RawPixelData));
+        ReadOnlySpan<byte> raw = RawPixelData.Span;
+        int pos = 0;
 
         // Decode each channel separately
         for (int channel = 0; channel < Channels; channel++)
         {
+            var output = result.Slice(channel * PixelCount, PixelCount);
             int pixelsDecoded = 0;
-            while (pixelsDecoded < PixelCount && reader.BaseStream.Position < reader.BaseStream.Length)
+            while (pixelsDecoded < PixelCount && pos < raw.Length)
             {
-                byte b = reader.ReadByte();
-
-                if (b == RepeatByte && reader.BaseStream.Position < reader.BaseStream.Length - 1)
+                if (raw[pos] == RepeatByte && pos + 2 < raw.Length)
                 {
                     // RLE: next byte is value, byte after is count
-                    byte value = reader.ReadByte();
-                    byte count = reader.ReadByte();
-
-                    for (int i = 0; i < count && pixelsDecoded < PixelCount; i++)
-                    {
-                        result[channel * PixelCount + pixelsDecoded] = value;
-                        pixelsDecoded++;
-                    }
+                    int count = Math.Min(raw[pos + 2], PixelCount - pixelsDecoded);
+                    output.Slice(pixelsDecoded, count).Fill(raw[pos + 1]);
+                    pixelsDecoded += count;
+                    pos += 3;
                 }
                 else
                 {
-                    // Literal byte
-                    result[channel * PixelCount + pixelsDecoded] = b;
-                    pixelsDecoded++;
+                    // Literal bytes: copy everything up to the next repeat marker at once.
+                    // A marker too close to the end to carry a run is itself a literal.
+                    int run = raw[pos] == RepeatByte ? -1 : raw[pos..].IndexOf(RepeatByte);
+                    if (run < 0)
+                        run = raw.Length - pos;
+                    run = Math.Min(run, PixelCount - pixelsDecoded);
+
+                    raw.Slice(pos, run).CopyTo(output[pixelsDecoded..]);
+                    pixelsDecoded += run;
+                    pos += run;
                 }
             }
         }
-
-        return result;
     }
 
     /// <summary>
     /// Decodes the texture to RGBA8888 format (only the main texture, not mipmaps).
     /// </summary>
-    public byte[] DecodeToRgba()
+    public byte[] DecodeToRgba() => DecodeToRgba(flipVertical: false);
+
+    /// <summary>
+    /// Decodes the main texture to RGBA8888, optionally writing rows bottom-up so
+    /// callers that need a vertical flip get it without a second pass.
+    /// </summary>
+    private byte[] DecodeToRgba(bool flipVertical)
     {
-        var decoded = DecodeRle();
         int mainPixels = Width * Height;
         var result = new byte[mainPixels * 4];
 
-        switch (Format)
+        // The channel-planar intermediate is only needed until conversion, so rent it
+        int decodedSize = PixelCount * Channels;
+        var rented = ArrayPool<byte>.Shared.Rent(decodedSize);
+        try
         {
-            case GfFormat.Palette:
-                DecodePalette(decoded, result, mainPixels);
-                break;
-            case GfFormat.RGB565:
-                DecodeRgb565(decoded, result, mainPixels);
-                break;
-            case GfFormat.RGBA1555:
-                DecodeRgba1555(decoded, result, mainPixels);
-                break;
-            case GfFormat.RGBA4444:
-                DecodeRgba4444(decoded, result, mainPixels);
-                break;
-            default:
-                // Unknown format, fill with gray
-                for (int i = 0; i < mainPixels; i++)
-                {
-                    result[i * 4 + 0] = 128;
-                    result[i * 4 + 1] = 128;
-                    result[i * 4 + 2] = 128;
-                    result[i * 4 + 3] = 255;
-                }
-                break;
+            var decoded = rented.AsSpan(0, decodedSize);
+            decoded.Clear();
+            DecodeRle(decoded);
+
+            switch (Format)
+            {
+                case GfFormat.Palette:
+                    DecodePalette(decoded, result, mainPixels, flipVertical);
+                    break;
+                case GfFormat.RGB565:
+                    DecodeRgb565(decoded, result, mainPixels, flipVertical);
+                    break;
+                case GfFormat.RGBA1555:
+                    DecodeRgba1555(decoded, result, mainPixels, flipVertical);
+                    break;
+                case GfFormat.RGBA4444:
+                    DecodeRgba4444(decoded, result, mainPixels, flipVertical);
+                    break;
+                default:
+                    // Unknown format, fill with opaque gray
+                    MemoryMarshal.Cast<byte, uint>(result.AsSpan()).Fill(0xFF808080);
+                    break;
+            }
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(rented);
         }
 
         return result;
     }
 
-    private void DecodePalette(byte[] decoded, byte[] result, int mainPixels)
+    private void DecodePalette(ReadOnlySpan<byte> decoded, byte[] result, int mainPixels, bool flipVertical)
     {
         if (Palette == null) return;
 
-        for (int i = 0; i < mainPixels && i < decoded.Length; i++)
+        // Expand the palette to packed RGBA once; indices past its end stay transparent black
+        Span<uint> colors = stackalloc uint[256];
+        for (int index = 0; index < colors.Length; index++)
         {
-            int paletteIndex = decoded[i];
-            int paletteOffset = paletteIndex * PaletteBytesPerColor;
+            int paletteOffset = index * PaletteBytesPerColor;
+            if (paletteOffset + PaletteBytesPerColor > Palette.Length)
+                break;
+
+            // Palette is BGR or BGRA
+            uint b = Palette[paletteOffset + 0];
+            uint g = Palette[paletteOffset + 1];
+            uint r = Palette[paletteOffset + 2];
+            uint a = PaletteBytesPerColor >= 4 ? Palette[paletteOffset + 3] : 255u;
+            colors[index] = r | (g << 8) | (b << 16) | (a << 24);
+        }
 
-            if (paletteOffset + PaletteBytesPerColor <= Palette.Length)
+        int count = Math.Min(mainPixels, decoded.Length);
+        var pixels = MemoryMarshal.Cast<byte, uint>(result.AsSpan());
+        for (int start = 0, y = 0; start < count; start += Width, y++)
+        {
+            int length = Math.Min(Width, count - start);
+            var source = decoded.Slice(start, length);
+            var row = pixels.Slice(DestinationRow(y, flipVertical) * Width, length);
+            for (int x = 0; x < row.Length; x++)
             {
-                // Palette is BGR or BGRA
-                result[i * 4 + 2] = Palette[paletteOffset + 0]; // B
-                result[i * 4 + 1] = Palette[paletteOffset + 1]; // G
-                result[i * 4 + 0] = Palette[paletteOffset + 2]; // R
-                result[i * 4 + 3] = PaletteBytesPerColor >= 4 ? Palette[paletteOffset + 3] : (byte)255; // A
+                row[x] = colors[source[x]];
             }
         }
     }
 
-    private void DecodeRgb565(byte[] decoded, byte[] result, int mainPixels)
+    // 16-bit pixel -> packed RGBA8888 lookups, built on first use (256 KiB each)
+    private static readonly Lazy<uint[]> Rgb565Lut = new(() => BuildLut(pixel =>
     {
-        // Channels are stored separately: all lo bytes, then all hi bytes
-        for (int i = 0; i < mainPixels; i++)
-        {
-            byte lo = decoded[i];
-            byte hi = decoded[PixelCount + i];
-            ushort pixel = (ushort)(lo | (hi << 8));
-
-            // bits 11-15: 5 bits, bits 5-10: 6 bits, bits 0-4: 5 bits
-            uint high5 = (uint)((pixel >> 11) & 0x1F);
-            uint g = (uint)((pixel >> 5) & 0x3F);
-            uint low5 = (uint)(pixel & 0x1F);
-
-            // Vignettes use BGR565 (for direct display), textures use RGB565 (for GPU)
-            uint r, b;
-            if (IsVignette)
-            {
-                b = high5;
-                r = low5;
-            }
-            else
-            {
-                r = high5;
-                b = low5;
-            }
+        // bits 11-15: 5 bits, bits 5-10: 6 bits, bits 0-4: 5 bits
+        uint r = (uint)((pixel >> 11) & 0x1F);
+        uint g = (uint)((pixel >> 5) & 0x3F);
+        uint b = (uint)(pixel & 0x1F);
+        return ((r * 255) / 31, (g * 255) / 63, (b * 255) / 31, 255); // No alpha in RGB565
+    }));
+
+    // Vignettes use BGR565 (for direct display), textures use RGB565 (for GPU)
+    private static readonly Lazy<uint[]> Bgr565Lut = new(() => BuildLut(pixel =>
+    {
+        uint b = (uint)((pixel >> 11) & 0x1F);
+        uint g = (uint)((pixel >> 5) & 0x3F);
+        uint r = (uint)(pixel & 0x1F);
+        return ((r * 255) / 31, (g * 255) / 63, (b * 255) / 31, 255);
+    }));
 
-            // Scale to 8-bit
-            result[i * 4 + 0] = (byte)((r * 255) / 31);
-            result[i * 4 + 1] = (byte)((g * 255) / 63);
-            result[i * 4 + 2] = (byte)((b * 255) / 31);
-            result[i * 4 + 3] = 255; // No alpha in RGB565
+    private static readonly Lazy<uint[]> Argb1555Lut = new(() => BuildLut(pixel =>
+    {
+        // Format is ARGB1555:
+        // bit 15: alpha (1 bit)
+        // bits 10-14: red (5 bits)
+        // bits 5-9: green (5 bits)
+        // bits 0-4: blue (5 bits)
+        uint a = (uint)((pixel >> 15) & 0x1);
+        uint r = (uint)((pixel >> 10) & 0x1F);
+        uint g = (uint)((pixel >> 5) & 0x1F);
+        uint b = (uint)(pixel & 0x1F);
+        return ((r * 255) / 31, (g * 255) / 31, (b * 255) / 31, a * 255);
+    }));
+
+    private static uint[] BuildLut(Func<ushort, (uint R, uint G, uint B, uint A)> decode)
+    {
+        var lut = new uint[65536];
+        for (int pixel = 0; pixel < lut.Length; pixel++)
+        {
+            var (r, g, b, a) = decode((ushort)pixel);
+            lut[pixel] = r | (g << 8) | (b << 16) | (a << 24);
         }
+        return lut;
     }
 
-    private void DecodeRgba1555(byte[] decoded, byte[] result, int mainPixels)
+    private void DecodeRgb565(ReadOnlySpan<byte> decoded, byte[] result, int mainPixels, bool flipVertical) =>
+        DecodeWithLut(decoded, result, mainPixels, flipVertical, IsVignette ? Bgr565Lut.Value : Rgb565Lut.Value);
+
+    private void DecodeRgba1555(ReadOnlySpan<byte> decoded, byte[] result, int mainPixels, bool flipVertical) =>
+        DecodeWithLut(decoded, result, mainPixels, flipVertical, Argb1555Lut.Value);
+
+    /// <summary>
+    /// ARGB4444 expands each nibble exactly as n * 17 (= n * 255 / 15), which is
+    /// cheap enough to do inline, so it skips the 256 KiB lookup table.
+    /// </summary>
+    private void DecodeRgba4444(ReadOnlySpan<byte> decoded, byte[] result, int mainPixels, bool flipVertical)
     {
-        // Channels are stored separately: all lo bytes, then all hi bytes
-        for (int i = 0; i < mainPixels; i++)
+        // Channels are stored separately: all lo bytes (green, blue), then all hi bytes (alpha, red)
+        var lo = decoded.Slice(0, mainPixels);
+        var hi = decoded.Slice(PixelCount, mainPixels);
+        var pixels = MemoryMarshal.Cast<byte, uint>(result.AsSpan(0, mainPixels * 4));
+
+        for (int start = 0, y = 0; start < mainPixels; start += Width, y++)
         {
-            byte lo = decoded[i];
-            byte hi = decoded[PixelCount + i];
-            ushort pixel = (ushort)(lo | (hi << 8));
-
-            // Format is ARGB1555:
-            // bit 15: alpha (1 bit)
-            // bits 10-14: red (5 bits)
-            // bits 5-9: green (5 bits)
-            // bits 0-4: blue (5 bits)
-            uint a = (uint)((pixel >> 15) & 0x1);
-            uint r = (uint)((pixel >> 10) & 0x1F);
-            uint g = (uint)((pixel >> 5) & 0x1F);
-            uint b = (uint)(pixel & 0x1F);
-
-            // Scale 5-bit values to 8-bit
-            result[i * 4 + 0] = (byte)((r * 255) / 31);
-            result[i * 4 + 1] = (byte)((g * 255) / 31);
-            result[i * 4 + 2] = (byte)((b * 255) / 31);
-            result[i * 4 + 3] = (byte)(a * 255);
+            var rowLo = lo.Slice(start, Width);
+            var rowHi = hi.Slice(start, Width);
+            var row = pixels.Slice(DestinationRow(y, flipVertical) * Width, Width);
+            for (int x = 0; x < row.Length; x++)
+            {
+                uint a = (uint)(rowHi[x] >> 4) * 17;
+                uint r = (uint)(rowHi[x] & 0xF) * 17;
+                uint g = (uint)(rowLo[x] >> 4) * 17;
+                uint b = (uint)(rowLo[x] & 0xF) * 17;
+                row[x] = r | (g << 8) | (b << 16) | (a << 24);
+            }
         }
     }
 
-    private void DecodeRgba4444(byte[] decoded, byte[] result, int mainPixels)
+    private void DecodeWithLut(ReadOnlySpan<byte> decoded, byte[] result, int mainPixels, bool flipVertical, uint[] lut)
     {
         // Channels are stored separately: all lo bytes, then all hi bytes
-        for (int i = 0; i < mainPixels; i++)
+        var lo = decoded.Slice(0, mainPixels);
+        var hi = decoded.Slice(PixelCount, mainPixels);
+        var pixels = MemoryMarshal.Cast<byte, uint>(result.AsSpan(0, mainPixels * 4));
+
+        for (int start = 0, y = 0; start < mainPixels; start += Width, y++)
         {
-            byte lo = decoded[i];
-            byte hi = decoded[PixelCount + i];
-            ushort pixel = (ushort)(lo | (hi << 8));
-
-            // Format is ARGB4444:
-            // bits 12-15: alpha (4 bits)
-            // bits 8-11: red (4 bits)
-            // bits 4-7: green (4 bits)
-            // bits 0-3: blue (4 bits)
-            uint a = (uint)((pixel >> 12) & 0xF);
-            uint r = (uint)((pixel >> 8) & 0xF);
-            uint g = (uint)((pixel >> 4) & 0xF);
-            uint b = (uint)(pixel & 0xF);
-
-            // Scale 4-bit values to 8-bit
-            result[i * 4 + 0] = (byte)((r * 255) / 15);
-            result[i * 4 + 1] = (byte)((g * 255) / 15);
-            result[i * 4 + 2] = (byte)((b * 255) / 15);
-            result[i * 4 + 3] = (byte)((a * 255) / 15);
+            var rowLo = lo.Slice(start, Width);
+            var rowHi = hi.Slice(start, Width);
+            var row = pixels.Slice(DestinationRow(y, flipVertical) * Width, Width);
+            for (int x = 0; x < row.Length; x++)
+            {
+                row[x] = lut[rowLo[x] | (rowHi[x] << 8)];
+            }
         }
     }
 
+    private int DestinationRow(int y, bool flipVertical) => flipVertical ? Height - 1 - y : y;
+
     /// <summary>
     /// Saves the texture as a PNG file.
     /// </summary>
     public void SaveAsPng(string outputPath)
     {
-        var rgba = DecodeToRgba();
-
-        using var image = Image.LoadPixelData<Rgba32>(rgba, Width, Height);
-
         // Textures (non-vignettes) need to be flipped vertically
-        // because they're stored for GPU texture coordinates (origin at bottom-left)
-        if (!IsVignette)
-        {
-            image.Mutate(x => x.Flip(FlipMode.Vertical));
-        }
+        // because they're stored for GPU texture coordinates (origin at bottom-left).
+        // The decoder writes their rows bottom-up directly, so no flip pass is needed.
+        var rgba = DecodeToRgba(flipVertical: !IsVignette);
 
-        image.SaveAsPng(outputPath);
+        // Wrap the decoded buffer rather than copying every pixel into a new image
+        using var image = Image.WrapMemory<Rgba32>(rgba.AsMemory(), Width, Height);
+        image.SaveAsPng(outputPath, PngEncoder);
     }
 }
 
@@ -168,12 +168,12 @@ public class GodotExporter
         var origin = new Vector3(m.M14, m.M24, m.M34);
 
         // Format: Transform3D(xx, xy, xz, yx, yy, yz, zx, zy, zz, ox, oy, oz)
-        sb.AppendLine(string.Format(CultureInfo.InvariantCulture,
-            "transform = Transform3D({0}, {1}, {2}, {3}, {4}, {5}, {6}, {7}, {8}, {9}, {10}, {11})",
-            basisX.X, basisX.Y, basisX.Z,
-            basisY.X, basisY.Y, basisY.Z,
-            basisZ.X, basisZ.Y, basisZ.Z,
-            origin.X, origin.Y, origin.Z));
+        // Formats each float straight into the builder, without boxing or an intermediate string
+        sb.Append(CultureInfo.InvariantCulture,
+            $"transform = Transform3D({basisX.X}, {basisX.Y}, {basisX.Z}, " +
+            $"{basisY.X}, {basisY.Y}, {basisY.Z}, " +
+            $"{basisZ.X}, {basisZ.Y}, {basisZ.Z}, " +
+            $"{origin.X}, {origin.Y}, {origin.Z})").AppendLine();
     }
 
     private static void WriteNodeMetadata(StringBuilder sb, SceneNode node)
@@ -199,7 +199,7 @@ public class GodotExporter
     private void WriteTscn(string outputPath, string rootName)
     {
         // Use UTF8 without BOM - Godot doesn't like BOM
-        using var writer = new StreamWriter(outputPath, false, new UTF8Encoding(false));
+        using var writer = new StreamWriter(outputPath, false, new UTF8Encoding(false), bufferSize: 1 << 16);
 
         // TSCN header
         writer.WriteLine("[gd_scene load_steps={0} format=3]", _extResources.Count + 1);
@@ -215,8 +215,11 @@ public class GodotExporter
         if (_extResources.Count > 0)
             writer.WriteLine();
 
-        // Node tree
-        writer.Write(_nodes.ToString());
+        // Node tree, written chunk by chunk rather than copied into one large string
+        foreach (var chunk in _nodes.GetChunks())
+        {
+            writer.Write(chunk.Span);
+        }
     }
 
     /// <summary>
@@ -8,18 +8,34 @@ public sealed record GodotExportResult(int ValidMeshCount, int ExportedMeshCount
 
 public static class GodotLevelExporter
 {
+    // Linux filesystems match names case-sensitively; Windows and macOS do not
+    private static readonly StringComparison ExtensionComparison =
+        OperatingSystem.IsLinux() ? StringComparison.Ordinal : StringComparison.OrdinalIgnoreCase;
+
     public static IReadOnlyList<MeshData> FilterValidMeshes(IEnumerable<MeshData> meshes) =>
-        meshes
-            .Where(m => m.Vertices.Length >= 3)
-            .Where(m => m.Indices != null && m.Indices.Length >= 3)
-            .Where(m =>
-            {
-                var minX = m.Vertices.Min(v => v.X);
-                var maxX = m.Vertices.Max(v => v.X);
-                var sizeX = maxX - minX;
-                return sizeX > 0.5f && sizeX < 1000;
-            })
-            .ToList();
+        meshes.Where(IsValidMesh).ToList();
+
+    /// <summary>
+    /// Applies the vertex count, triangle and X-extent filters in one predicate,
+    /// walking the vertices once for only the axis the size check needs.
+    /// </summary>
+    private static bool IsValidMesh(MeshData mesh)
+    {
+        var vertices = mesh.Vertices;
+        if (vertices.Length < 3 || mesh.Indices == null || mesh.Indices.Length < 3)
+            return false;
+
+        float minX = float.MaxValue;
+        float maxX = float.MinValue;
+        foreach (var v in vertices)
+        {
+            minX = Math.Min(minX, v.X);
+            maxX = Math.Max(maxX, v.X);
+        }
+
+        var sizeX = maxX - minX;
+        return sizeX > 0.5f && sizeX < 1000;
+    }
 
     public static GodotExportResult Export(Level level, string outputDir, IEnumerable<string>? textureSearchRoots = null)
     {
@@ -93,16 +109,16 @@ public static class GodotLevelExporter
                 continue;
             }
 
-            foreach (var file in Directory.EnumerateFiles(textureBaseDir, "*.tga", SearchOption.AllDirectories))
-            {
-                var fileName = Path.GetFileName(file);
-                textureLookup.TryAdd(fileName, file);
-            }
-
-            foreach (var file in Directory.EnumerateFiles(textureBaseDir, "*.png", SearchOption.AllDirectories))
+            // Walk each tree once; .tga and .png keys never collide since names keep their extension.
+            foreach (var file in Directory.EnumerateFiles(textureBaseDir, "*", SearchOption.AllDirectories))
             {
                 var fileName = Path.GetFileName(file);
-                textureLookup.TryAdd(fileName, file);
+                // Match extensions with the filesystem's casing, like the "*.tga"/"*.png" patterns this replaced
+                if (fileName.EndsWith(".tga", ExtensionComparison) ||
+                    fileName.EndsWith(".png", ExtensionComparison))
+                {
+                    textureLookup.TryAdd(fileName, file);
+                }
             }
         }
 
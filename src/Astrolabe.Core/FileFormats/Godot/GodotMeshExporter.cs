@@ -1,5 +1,7 @@
+using System.Buffers;
 using System.Globalization;
 using System.Numerics;
+using System.Runtime.InteropServices;
 using System.Text;
 using Astrolabe.Core.FileFormats.Geometry;
 
@@ -47,7 +49,8 @@ public static class GodotMeshExporter
 
         Directory.CreateDirectory(Path.GetDirectoryName(outputPath) ?? ".");
 
-        using var writer = new StreamWriter(outputPath, false, new UTF8Encoding(false));
+        // Surfaces are written as long PackedByteArray literals; use a large buffer
+        using var writer = new StreamWriter(outputPath, false, new UTF8Encoding(false), bufferSize: 1 << 16);
         var loadSteps = 1 + materialIds.Count + textureIds.Count;
         writer.WriteLine($"[gd_resource type=\"ArrayMesh\" load_steps={loadSteps} format=3]");
         writer.WriteLine();
@@ -140,61 +143,61 @@ public static class GodotMeshExporter
         }
     }
 
-    private static List<MeshVertex> BuildSubMeshVertices(MeshData mesh, SubMeshData subMesh)
+    private static SurfaceVertices BuildSubMeshVertices(MeshData mesh, SubMeshData subMesh)
     {
-        var vertices = new List<MeshVertex>(subMesh.Triangles.Length);
+        var vertices = new SurfaceVertices(subMesh.Triangles.Length);
         var hasNormals = mesh.Normals != null && mesh.Normals.Length == mesh.Vertices.Length;
         var hasUVs = subMesh.UVs.Length > 0 && subMesh.UVIndices.Length > 0;
 
-        for (var i = 0; i < subMesh.Triangles.Length - 2; i += 3)
+        var positions = mesh.Vertices;
+        var triangles = AsTriangles(subMesh.Triangles);
+        for (var t = 0; t < triangles.Length; t++)
         {
-            var i0 = subMesh.Triangles[i];
-            var i1 = subMesh.Triangles[i + 1];
-            var i2 = subMesh.Triangles[i + 2];
-
-            if (!IsValidVertexIndex(mesh, i0) || !IsValidVertexIndex(mesh, i1) || !IsValidVertexIndex(mesh, i2))
+            var (i0, i1, i2) = triangles[t];
+            if (!IsValidTriangle(i0, i1, i2, positions.Length))
             {
                 continue;
             }
 
-            var v0 = mesh.Vertices[i0];
-            var v1 = mesh.Vertices[i1];
-            var v2 = mesh.Vertices[i2];
+            var v0 = positions[i0];
+            var v1 = positions[i1];
+            var v2 = positions[i2];
             var faceNormal = CalculateNormal(v0, v1, v2);
 
-            vertices.Add(new MeshVertex(v0, GetNormal(mesh, i0, faceNormal, hasNormals), GetSubMeshUV(subMesh, i, hasUVs)));
-            vertices.Add(new MeshVertex(v1, GetNormal(mesh, i1, faceNormal, hasNormals), GetSubMeshUV(subMesh, i + 1, hasUVs)));
-            vertices.Add(new MeshVertex(v2, GetNormal(mesh, i2, faceNormal, hasNormals), GetSubMeshUV(subMesh, i + 2, hasUVs)));
+            var i = t * 3;
+            vertices.Add(v0, GetNormal(mesh, i0, faceNormal, hasNormals), GetSubMeshUV(subMesh, i, hasUVs));
+            vertices.Add(v1, GetNormal(mesh, i1, faceNormal, hasNormals), GetSubMeshUV(subMesh, i + 1, hasUVs));
+            vertices.Add(v2, GetNormal(mesh, i2, faceNormal, hasNormals), GetSubMeshUV(subMesh, i + 2, hasUVs));
         }
 
         return vertices;
     }
 
-    private static List<MeshVertex> BuildIndexedVertices(MeshData mesh, int[] indices)
+    private static SurfaceVertices BuildIndexedVertices(MeshData mesh, int[] indices)
     {
-        var vertices = new List<MeshVertex>(indices.Length);
+        var vertices = new SurfaceVertices(indices.Length);
         var hasNormals = mesh.Normals != null && mesh.Normals.Length == mesh.Vertices.Length;
         var hasUVs = mesh.UVs != null && mesh.UVIndices != null && mesh.UVIndices.Length > 0;
 
-        for (var i = 0; i < indices.Length - 2; i += 3)
+        var positions = mesh.Vertices;
+        var triangles = AsTriangles(indices);
+        for (var t = 0; t < triangles.Length; t++)
         {
-            var i0 = indices[i];
-            var i1 = indices[i + 1];
-            var i2 = indices[i + 2];
-
-            if (!IsValidVertexIndex(mesh, i0) || !IsValidVertexIndex(mesh, i1) || !IsValidVertexIndex(mesh, i2))
+            var (i0, i1, i2) = triangles[t];
+            if (!IsValidTriangle(i0, i1, i2, positions.Length))
             {
                 continue;
             }
 
-            var v0 = mesh.Vertices[i0];
-            var v1 = mesh.Vertices[i1];
-            var v2 = mesh.Vertices[i2];
+            var v0 = positions[i0];
+            var v1 = positions[i1];
+            var v2 = positions[i2];
             var faceNormal = CalculateNormal(v0, v1, v2);
 
-            vertices.Add(new MeshVertex(v0, GetNormal(mesh, i0, faceNormal, hasNormals), GetMeshUV(mesh, i, hasUVs)));
-            vertices.Add(new MeshVertex(v1, GetNormal(mesh, i1, faceNormal, hasNormals), GetMeshUV(mesh, i + 1, hasUVs)));
-            vertices.Add(new MeshVertex(v2, GetNormal(mesh, i2, faceNormal, hasNormals), GetMeshUV(mesh, i + 2, hasUVs)));
+            var i = t * 3;
+            vertices.Add(v0, GetNormal(mesh, i0, faceNormal, hasNormals), GetMeshUV(mesh, i, hasUVs));
+            vertices.Add(v1, GetNormal(mesh, i1, faceNormal, hasNormals), GetMeshUV(mesh, i + 1, hasUVs));
+            vertices.Add(v2, GetNormal(mesh, i2, faceNormal, hasNormals), GetMeshUV(mesh, i + 2, hasUVs));
         }
 
         return vertices;
@@ -222,10 +225,32 @@ public static class GodotMeshExporter
 
     private static void WriteSurface(StreamWriter writer, MeshSurface surface, bool isLast)
     {
-        var (position, size) = CalculateAabb(surface.Vertices);
-        var vertexData = BuildVertexData(surface.Vertices);
-        var attributeData = BuildAttributeData(surface.Vertices);
+        var positions = CollectionsMarshal.AsSpan(surface.Vertices.Positions);
+        var (position, size) = CalculateAabb(positions);
+
+        // Vertex data is assembled once in a pooled buffer; attribute data is just the
+        // UV list's bytes, so it is formatted straight from the list without a copy
+        var vertexDataLength = positions.Length * VertexStride;
+        var vertexData = ArrayPool<byte>.Shared.Rent(vertexDataLength);
+        try
+        {
+            BuildVertexData(positions, CollectionsMarshal.AsSpan(surface.Vertices.Normals), vertexData.AsSpan(0, vertexDataLength));
+            WriteSurfaceFields(writer, surface, position, size, vertexData.AsSpan(0, vertexDataLength), isLast);
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(vertexData);
+        }
+    }
 
+    private static void WriteSurfaceFields(
+        StreamWriter writer,
+        MeshSurface surface,
+        Vector3 position,
+        Vector3 size,
+        ReadOnlySpan<byte> vertexData,
+        bool isLast)
+    {
         writer.WriteLine("{");
         writer.WriteLine($"\"aabb\": AABB({Format(position.X)}, {Format(position.Y)}, {Format(position.Z)}, {Format(size.X)}, {Format(size.Y)}, {Format(size.Z)}),");
         writer.WriteLine($"\"format\": {SurfaceFormat},");
@@ -235,76 +260,76 @@ public static class GodotMeshExporter
         writer.WriteLine(",");
         writer.WriteLine($"\"vertex_count\": {surface.Vertices.Count},");
         writer.Write("\"attribute_data\": ");
-        WritePackedByteArray(writer, attributeData);
+        WritePackedByteArray(writer, MemoryMarshal.AsBytes(CollectionsMarshal.AsSpan(surface.Vertices.UVs)));
         writer.WriteLine(",");
         writer.WriteLine($"\"material\": SubResource(\"{surface.Material.ResourceId}\"),");
         writer.WriteLine($"\"name\": \"{EscapeString(surface.Name)}\"");
         writer.WriteLine(isLast ? "}" : "},");
     }
 
-    private static byte[] BuildVertexData(IReadOnlyList<MeshVertex> vertices)
-    {
-        using var stream = new MemoryStream();
-        using var writer = new BinaryWriter(stream, Encoding.UTF8, leaveOpen: true);
+    // Bytes per vertex in vertex_data: a float3 position and a packed normal + tangent
+    private const int VertexStride = 20;
 
-        foreach (var vertex in vertices)
-        {
-            writer.Write(vertex.Position.X);
-            writer.Write(vertex.Position.Y);
-            writer.Write(vertex.Position.Z);
-        }
+    private static void BuildVertexData(ReadOnlySpan<Vector3> positions, ReadOnlySpan<Vector3> normals, Span<byte> data)
+    {
+        // Positions (3 floats) for every vertex, then packed normal + tangent (2 uints).
+        // Positions are already contiguous, so they go in as one block copy.
+        var count = positions.Length;
+        MemoryMarshal.AsBytes(positions).CopyTo(data);
 
-        foreach (var vertex in vertices)
+        var packed = MemoryMarshal.Cast<byte, uint>(data[(count * 12)..]);
+        for (var i = 0; i < count; i++)
         {
-            writer.Write(PackOctahedron(vertex.Normal));
-            writer.Write(PackOctahedronTangent(CreateTangent(vertex.Normal), 1.0f));
+            packed[i * 2] = PackOctahedron(normals[i]);
+            packed[i * 2 + 1] = PackOctahedronTangent(CreateTangent(normals[i]), 1.0f);
         }
-
-        writer.Flush();
-        return stream.ToArray();
     }
 
-    private static byte[] BuildAttributeData(IReadOnlyList<MeshVertex> vertices)
-    {
-        using var stream = new MemoryStream();
-        using var writer = new BinaryWriter(stream, Encoding.UTF8, leaveOpen: true);
+    // Decimal text for every byte value, prefixed with the list separator
+    private static readonly string[] SeparatedByteLiterals = Enumerable.Range(0, 256)
+        .Select(b => ", " + b.ToString(CultureInfo.InvariantCulture))
+        .ToArray();
 
-        foreach (var vertex in vertices)
-        {
-            writer.Write(vertex.UV.X);
-            writer.Write(vertex.UV.Y);
-        }
-
-        writer.Flush();
-        return stream.ToArray();
-    }
+    private const int PackedChunkChars = 1 << 14;
 
-    private static void WritePackedByteArray(StreamWriter writer, byte[] bytes)
+    private static void WritePackedByteArray(StreamWriter writer, ReadOnlySpan<byte> bytes)
     {
         writer.Write("PackedByteArray(");
-        for (var i = 0; i < bytes.Length; i++)
+        if (bytes.Length > 0)
         {
-            if (i > 0)
+            // Format into a local chunk and hand the writer whole blocks instead of one short string per byte
+            var chunk = ArrayPool<char>.Shared.Rent(PackedChunkChars);
+            try
             {
-                writer.Write(", ");
-            }
+                var first = SeparatedByteLiterals[bytes[0]].AsSpan(2);
+                first.CopyTo(chunk);
+                var used = first.Length;
+                for (var i = 1; i < bytes.Length; i++)
+                {
+                    var literal = SeparatedByteLiterals[bytes[i]];
+                    if (used + literal.Length > chunk.Length)
+                    {
+                        writer.Write(chunk, 0, used);
+                        used = 0;
+                    }
+
+                    literal.CopyTo(chunk.AsSpan(used));
+                    used += literal.Length;
+                }
 
-            writer.Write(bytes[i].ToString(CultureInfo.InvariantCulture));
+                writer.Write(chunk, 0, used);
+            }
+            finally
+            {
+                ArrayPool<char>.Shared.Return(chunk);
+            }
         }
         writer.Write(")");
     }
 
-    private static (Vector3 Position, Vector3 Size) CalculateAabb(IReadOnlyList<MeshVertex> vertices)
+    private static (Vector3 Position, Vector3 Size) CalculateAabb(ReadOnlySpan<Vector3> positions)
     {
-        var min = new Vector3(float.MaxValue, float.MaxValue, float.MaxValue);
-        var max = new Vector3(float.MinValue, float.MinValue, float.MinValue);
-
-        foreach (var vertex in vertices)
-        {
-            min = Vector3.Min(min, vertex.Position);
-            max = Vector3.Max(max, vertex.Position);
-        }
-
+        var (min, max) = MeshData.GetBounds(positions);
         var size = max - min;
         size.X = MathF.Max(size.X, 0.00001f);
         size.Y = MathF.Max(size.Y, 0.00001f);
@@ -312,8 +337,16 @@ public static class GodotMeshExporter
         return (min, size);
     }
 
-    private static bool IsValidVertexIndex(MeshData mesh, int index) =>
-        index >= 0 && index < mesh.Vertices.Length;
+    /// <summary>
+    /// Views a flat index list as whole triangles, dropping any trailing partial one,
+    /// so each triangle is read as a single three-int struct.
+    /// </summary>
+    private static ReadOnlySpan<Triangle> AsTriangles(int[] indices) =>
+        MemoryMarshal.Cast<int, Triangle>(indices.AsSpan(0, indices.Length / 3 * 3));
+
+    // Unsigned compares reject negative indices along with ones past the end
+    private static bool IsValidTriangle(int i0, int i1, int i2, int vertexCount) =>
+        (uint)i0 < (uint)vertexCount && (uint)i1 < (uint)vertexCount && (uint)i2 < (uint)vertexCount;
 
     private static Vector3 GetNormal(MeshData mesh, int index, Vector3 fallback, bool hasNormals)
     {
@@ -365,12 +398,12 @@ public static class GodotMeshExporter
 
     private static Vector3 SanitizeNormal(Vector3 normal, Vector3 fallback)
     {
-        if (!IsFinite(normal) || normal.LengthSquared() < 0.000001f)
+        if (!IsUsableDirection(normal))
         {
             normal = fallback;
         }
 
-        if (!IsFinite(normal) || normal.LengthSquared() < 0.000001f)
+        if (!IsUsableDirection(normal))
         {
             return Vector3.UnitY;
         }
@@ -381,11 +414,11 @@ public static class GodotMeshExporter
     private static Vector3 CreateTangent(Vector3 normal)
     {
         var tangent = Vector3.Cross(new Vector3(normal.Z, -normal.X, normal.Y), normal);
-        if (!IsFinite(tangent) || tangent.LengthSquared() < 0.000001f)
+        if (!IsUsableDirection(tangent))
         {
             tangent = Vector3.Cross(Vector3.UnitX, normal);
         }
-        if (!IsFinite(tangent) || tangent.LengthSquared() < 0.000001f)
+        if (!IsUsableDirection(tangent))
         {
             tangent = Vector3.UnitX;
         }
@@ -449,8 +482,10 @@ public static class GodotMeshExporter
         return false;
     }
 
-    private static bool IsFinite(Vector3 value) =>
-        float.IsFinite(value.X) && float.IsFinite(value.Y) && float.IsFinite(value.Z);
+    // A single range check on the squared length rejects zero, NaN and infinite vectors:
+    // NaN fails both compares and any non-finite component overflows past MaxValue
+    private static bool IsUsableDirection(Vector3 value) =>
+        value.LengthSquared() is >= 0.000001f and <= float.MaxValue;
 
     private static string Format(float value) =>
         value.ToString("G9", CultureInfo.InvariantCulture);
@@ -460,7 +495,7 @@ public static class GodotMeshExporter
 
     private sealed class MeshSurface
     {
-        public MeshSurface(string name, List<MeshVertex> vertices, MaterialResource material)
+        public MeshSurface(string name, SurfaceVertices vertices, MaterialResource material)
         {
             Name = name;
             Vertices = vertices;
@@ -468,11 +503,37 @@ public static class GodotMeshExporter
         }
 
         public string Name { get; }
-        public List<MeshVertex> Vertices { get; }
+        public SurfaceVertices Vertices { get; }
         public MaterialResource Material { get; set; }
     }
 
-    private readonly record struct MeshVertex(Vector3 Position, Vector3 Normal, Vector2 UV);
+    /// <summary>
+    /// Surface vertices kept as parallel position, normal and UV arrays, matching the
+    /// sectioned layout Godot expects so positions and UVs can be copied out whole.
+    /// </summary>
+    private sealed class SurfaceVertices
+    {
+        public SurfaceVertices(int capacity)
+        {
+            Positions = new List<Vector3>(capacity);
+            Normals = new List<Vector3>(capacity);
+            UVs = new List<Vector2>(capacity);
+        }
+
+        public List<Vector3> Positions { get; }
+        public List<Vector3> Normals { get; }
+        public List<Vector2> UVs { get; }
+        public int Count => Positions.Count;
+
+        public void Add(Vector3 position, Vector3 normal, Vector2 uv)
+        {
+            Positions.Add(position);
+            Normals.Add(normal);
+            UVs.Add(uv);
+        }
+    }
+
+    private readonly record struct Triangle(int I0, int I1, int I2);
 
     private sealed record MaterialResource(
         string Key,
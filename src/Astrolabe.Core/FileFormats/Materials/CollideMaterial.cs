@@ -1,3 +1,5 @@
+using System.Collections.Concurrent;
+
 namespace Astrolabe.Core.FileFormats.Materials;
 
 /// <summary>
@@ -59,7 +61,8 @@ public class CollideMaterial
 public class CollideMaterialReader
 {
     private readonly MemoryContext _memory;
-    private readonly Dictionary<int, CollideMaterial> _cache = new();
+    // Shared by concurrent block scans
+    private readonly ConcurrentDictionary<int, CollideMaterial> _cache = new();
 
     public CollideMaterialReader(MemoryContext memory)
     {
@@ -85,8 +88,7 @@ public class CollideMaterialReader
             mat.Identifier = (CollisionFlags)reader.ReadUInt16();    // 0x02
             mat.TypeForAI = reader.ReadUInt32();                     // 0x04
 
-            _cache[address] = mat;
-            return mat;
+            return _cache.GetOrAdd(address, mat);
         }
         catch
         {
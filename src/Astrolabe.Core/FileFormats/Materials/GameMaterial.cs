@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using Astrolabe.Core.Hub;
 
 namespace Astrolabe.Core.FileFormats.Materials;
@@ -36,7 +37,8 @@ public class GameMaterialReader
     private readonly MemoryContext _memory;
     private readonly VisualMaterialReader _visualMaterialReader;
     private readonly CollideMaterialReader _collideMaterialReader;
-    private readonly Dictionary<int, GameMaterial> _cache = new();
+    // Shared by concurrent block scans
+    private readonly ConcurrentDictionary<int, GameMaterial> _cache = new();
 
     public GameMaterialReader(MemoryContext memory)
     {
@@ -76,8 +78,7 @@ public class GameMaterialReader
                 mat.CollideMaterial = _collideMaterialReader.Read(mat.OffCollideMaterial);
             }
 
-            _cache[address] = mat;
-            return mat;
+            return _cache.GetOrAdd(address, mat);
         }
         catch
         {
@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Numerics;
 using Astrolabe.Core.Hub;
 
@@ -92,7 +93,8 @@ public class VisualMaterial
 public class VisualMaterialReader
 {
     private readonly MemoryContext _memory;
-    private readonly Dictionary<int, VisualMaterial> _cache = new();
+    // Shared by concurrent block scans
+    private readonly ConcurrentDictionary<int, VisualMaterial> _cache = new();
 
     public VisualMaterialReader(MemoryContext memory)
     {
@@ -142,8 +144,7 @@ public class VisualMaterialReader
             reader.ReadUInt32(); // 0x70 unknown
             mat.Properties = reader.ReadByte(); // 0x74
 
-            _cache[address] = mat;
-            return mat;
+            return _cache.GetOrAdd(address, mat);
         }
         catch
         {
@@ -10,6 +10,13 @@ public class MemoryContext
 {
     private readonly Dictionary<ushort, SnaBlock> _blocks = new();
     private readonly Dictionary<int, PointerInfo> _pointers = new();
+    private readonly Dictionary<ushort, List<int>> _pointersByTarget = new();
+
+    // Pointer locations never change after construction, so keep them sorted once for range queries
+    private int[] _pointerLocations = [];
+
+    // Loaded blocks sorted by base address, for binary-search address lookups
+    private BlockRanges _ranges;
 
     public SnaReader Sna { get; }
     public RelocationTableReader? Rtb { get; }
@@ -24,6 +31,7 @@ public class MemoryContext
         {
             _blocks[block.Key] = block;
         }
+        _ranges = BuildRanges();
 
         // Build pointer map from relocation table
         if (rtb != null)
@@ -66,6 +74,20 @@ public class MemoryContext
                 };
             }
         }
+
+        _pointerLocations = _pointers.Keys.ToArray();
+        Array.Sort(_pointerLocations);
+
+        // Index pointer locations by target block so lookups don't rescan the map
+        foreach (var (location, info) in _pointers)
+        {
+            if (!_pointersByTarget.TryGetValue(info.TargetKey, out var locations))
+            {
+                locations = new List<int>();
+                _pointersByTarget[info.TargetKey] = locations;
+            }
+            locations.Add(location);
+        }
     }
 
     /// <summary>
@@ -73,24 +95,28 @@ public class MemoryContext
     /// </summary>
     public byte[]? ReadBytes(int memoryAddress, int length)
     {
-        // Find which block contains this address
-        foreach (var block in Sna.Blocks)
-        {
-            if (block.Data == null) continue;
+        var block = GetBlockContaining(memoryAddress);
+        if (block == null) return null;
 
-            int endAddr = block.BaseInMemory + block.Data.Length;
-            if (memoryAddress >= block.BaseInMemory && memoryAddress < endAddr)
-            {
-                int offset = memoryAddress - block.BaseInMemory;
-                if (offset + length > block.Data.Length)
-                    return null;
+        int offset = memoryAddress - block.BaseInMemory;
+        if (offset + length > block.Data!.Length)
+            return null;
 
-                var result = new byte[length];
-                Array.Copy(block.Data, offset, result, 0, length);
-                return result;
-            }
-        }
-        return null;
+        var result = new byte[length];
+        Array.Copy(block.Data, offset, result, 0, length);
+        return result;
+    }
+
+    /// <summary>
+    /// Gets the bytes from a memory address to the end of its containing block,
+    /// or an empty span if the address is not mapped.
+    /// </summary>
+    public ReadOnlySpan<byte> GetSpanAt(int memoryAddress)
+    {
+        var block = GetBlockContaining(memoryAddress);
+        if (block == null) return ReadOnlySpan<byte>.Empty;
+
+        return block.Data.AsSpan(memoryAddress - block.BaseInMemory);
     }
 
     /// <summary>
@@ -98,22 +124,80 @@ public class MemoryContext
     /// </summary>
     public BinaryReader? GetReaderAt(int memoryAddress)
     {
-        foreach (var block in Sna.Blocks)
+        var block = GetBlockContaining(memoryAddress);
+        if (block == null) return null;
+
+        var ms = new MemoryStream(block.Data!);
+        ms.Position = memoryAddress - block.BaseInMemory;
+        return new BinaryReader(ms);
+    }
+
+    /// <summary>
+    /// Gets the loaded block whose memory range contains an address.
+    /// </summary>
+    public SnaBlock? GetBlockContaining(int memoryAddress)
+    {
+        // The count catches direct edits to the public list; the version catches merges
+        // that replace empty blocks in place
+        var ranges = Volatile.Read(ref _ranges);
+        if (ranges.Version != Sna.Version || ranges.BlockCount != Sna.Blocks.Count)
+        {
+            ranges = BuildRanges();
+            Volatile.Write(ref _ranges, ranges);
+        }
+
+        if (ranges.Overlap)
         {
-            if (block.Data == null) continue;
+            // Overlapping blocks resolve to the first match in block order
+            foreach (var block in Sna.Blocks)
+            {
+                if (block.Data == null) continue;
+
+                int endAddr = block.BaseInMemory + block.Data.Length;
+                if (memoryAddress >= block.BaseInMemory && memoryAddress < endAddr)
+                    return block;
+            }
+            return null;
+        }
+
+        int index = Array.BinarySearch(ranges.Starts, memoryAddress);
+        if (index < 0)
+            index = ~index - 1;
+        if (index < 0)
+            return null;
+
+        var candidate = ranges.Blocks[index];
+        return memoryAddress < candidate.BaseInMemory + candidate.Data!.Length ? candidate : null;
+    }
 
-            int endAddr = block.BaseInMemory + block.Data.Length;
-            if (memoryAddress >= block.BaseInMemory && memoryAddress < endAddr)
+    private BlockRanges BuildRanges()
+    {
+        var version = Sna.Version;
+        var blockCount = Sna.Blocks.Count;
+        var loaded = Sna.Blocks
+            .Where(b => b.Data is { Length: > 0 })
+            .OrderBy(b => b.BaseInMemory)
+            .ToArray();
+
+        bool overlap = false;
+        for (int i = 1; i < loaded.Length; i++)
+        {
+            if (loaded[i].BaseInMemory < loaded[i - 1].BaseInMemory + loaded[i - 1].Data!.Length)
             {
-                int offset = memoryAddress - block.BaseInMemory;
-                var ms = new MemoryStream(block.Data);
-                ms.Position = offset;
-                return new BinaryReader(ms);
+                overlap = true;
+                break;
             }
         }
-        return null;
+
+        return new BlockRanges(loaded.Select(b => b.BaseInMemory).ToArray(), loaded, overlap, blockCount, version);
     }
 
+    /// <summary>
+    /// Immutable snapshot of the block range index, published as one reference so
+    /// concurrent readers never see a half-built index.
+    /// </summary>
+    private sealed record BlockRanges(int[] Starts, SnaBlock[] Blocks, bool Overlap, int BlockCount, int Version);
+
     /// <summary>
     /// Gets pointer info at a memory address (if it's a known pointer location).
     /// </summary>
@@ -122,6 +206,11 @@ public class MemoryContext
         return _pointers.GetValueOrDefault(memoryAddress);
     }
 
+    /// <summary>
+    /// Gets every known pointer location in ascending address order.
+    /// </summary>
+    public ReadOnlySpan<int> GetPointerLocations() => _pointerLocations;
+
     /// <summary>
     /// Follows a pointer at a memory address and returns a reader at the target.
     /// </summary>
@@ -139,9 +228,10 @@ public class MemoryContext
     public IEnumerable<(int sourceAddr, PointerInfo ptr)> GetPointersToBlock(byte module, byte id)
     {
         ushort targetKey = (ushort)((module << 8) | id);
-        return _pointers
-            .Where(kvp => kvp.Value.TargetKey == targetKey)
-            .Select(kvp => (kvp.Key, kvp.Value));
+        if (!_pointersByTarget.TryGetValue(targetKey, out var locations))
+            return [];
+
+        return locations.Select(location => (location, _pointers[location]));
     }
 
     /// <summary>
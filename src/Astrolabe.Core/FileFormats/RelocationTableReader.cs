@@ -10,23 +10,25 @@ public class RelocationTableReader
 {
     public List<RelocationPointerBlock> PointerBlocks { get; } = new();
 
-    private readonly byte[] _data;
+    private Dictionary<ushort, RelocationPointerBlock>? _blockIndex;
+    private int _indexedCount;
 
     public RelocationTableReader(string filePath)
     {
-        _data = File.ReadAllBytes(filePath);
-        Parse();
+        // Parse straight from the file rather than holding a full copy of it
+        using var stream = new FileStream(filePath, FileMode.Open, FileAccess.Read, FileShare.Read,
+            bufferSize: 1 << 16, FileOptions.SequentialScan);
+        Parse(stream);
     }
 
     public RelocationTableReader(byte[] data)
     {
-        _data = data;
-        Parse();
+        Parse(new MemoryStream(data, writable: false));
     }
 
-    private void Parse()
+    private void Parse(Stream stream)
     {
-        using var reader = new BinaryReader(new MemoryStream(_data));
+        using var reader = new BinaryReader(stream);
 
         // Montreal format: count byte, then blocks
         byte blockCount = reader.ReadByte();
@@ -126,14 +128,31 @@ public class RelocationTableReader
     {
         using var inputStream = new MemoryStream(compressedData);
         using var lzoStream = new LzoStream(inputStream, CompressionMode.Decompress);
-        using var outputStream = new MemoryStream();
 
+        // The header gives the decompressed size; decode straight into it
+        var data = new byte[Math.Max(decompressedSize, 0)];
+        int total = lzoStream.ReadAtLeast(data, data.Length, throwOnEndOfStream: false);
+        if (total < data.Length)
+        {
+            Array.Resize(ref data, total);
+            return data;
+        }
+
+        // Keep any output beyond the declared size, as the stream produced it
         var buffer = new byte[4096];
-        int bytesRead;
-        while ((bytesRead = lzoStream.Read(buffer, 0, buffer.Length)) > 0)
+        int bytesRead = lzoStream.Read(buffer, 0, buffer.Length);
+        if (bytesRead == 0)
+        {
+            return data;
+        }
+
+        using var outputStream = new MemoryStream();
+        outputStream.Write(data);
+        do
         {
             outputStream.Write(buffer, 0, bytesRead);
         }
+        while ((bytesRead = lzoStream.Read(buffer, 0, buffer.Length)) > 0);
 
         return outputStream.ToArray();
     }
@@ -143,7 +162,28 @@ public class RelocationTableReader
     /// </summary>
     public RelocationPointerBlock? GetBlock(byte module, byte id)
     {
-        return PointerBlocks.FirstOrDefault(b => b.Module == module && b.Id == id);
+        ushort key = (ushort)((module << 8) | id);
+        return GetBlockIndex().GetValueOrDefault(key);
+    }
+
+    private Dictionary<ushort, RelocationPointerBlock> GetBlockIndex()
+    {
+        // PointerBlocks is a public list, so rebuild if it has grown or shrunk since
+        var index = Volatile.Read(ref _blockIndex);
+        var count = PointerBlocks.Count;
+        if (index == null || _indexedCount != count)
+        {
+            index = new Dictionary<ushort, RelocationPointerBlock>(count);
+            foreach (var block in PointerBlocks)
+            {
+                index.TryAdd(block.Key, block);
+            }
+
+            // Record the count before publishing, so a reader that sees the new index sees its count too
+            _indexedCount = count;
+            Volatile.Write(ref _blockIndex, index);
+        }
+        return index;
     }
 
     /// <summary>
@@ -152,9 +192,10 @@ public class RelocationTableReader
     /// </summary>
     public void Merge(RelocationTableReader other)
     {
+        var index = GetBlockIndex();
         foreach (var otherBlock in other.PointerBlocks)
         {
-            var existingBlock = GetBlock(otherBlock.Module, otherBlock.Id);
+            var existingBlock = index.GetValueOrDefault(otherBlock.Key);
             if (existingBlock != null)
             {
                 // Merge pointers into existing block
@@ -174,6 +215,8 @@ public class RelocationTableReader
             {
                 // Add new block
                 PointerBlocks.Add(otherBlock);
+                index.TryAdd(otherBlock.Key, otherBlock);
+                _indexedCount = PointerBlocks.Count;
             }
         }
     }
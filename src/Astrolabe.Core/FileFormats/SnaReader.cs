@@ -9,23 +9,31 @@ public class SnaReader
 {
     public List<SnaBlock> Blocks { get; } = new();
 
-    private readonly byte[] _data;
+    private Dictionary<ushort, SnaBlock>? _blockIndex;
+    private int _indexedCount;
+
+    /// <summary>
+    /// Bumped whenever <see cref="Merge"/> changes the block list, including in-place
+    /// replacements that leave the count unchanged, so address indexes know to rebuild.
+    /// </summary>
+    internal int Version { get; private set; }
 
     public SnaReader(string filePath)
     {
-        _data = File.ReadAllBytes(filePath);
-        Parse();
+        // Parse straight from the file rather than holding a full copy of it
+        using var stream = new FileStream(filePath, FileMode.Open, FileAccess.Read, FileShare.Read,
+            bufferSize: 1 << 16, FileOptions.SequentialScan);
+        Parse(stream);
     }
 
     public SnaReader(byte[] data)
     {
-        _data = data;
-        Parse();
+        Parse(new MemoryStream(data, writable: false));
     }
 
-    private void Parse()
+    private void Parse(Stream stream)
     {
-        using var reader = new BinaryReader(new MemoryStream(_data));
+        using var reader = new BinaryReader(stream);
 
         while (reader.BaseStream.Position < reader.BaseStream.Length - 4)
         {
@@ -109,14 +117,31 @@ public class SnaReader
     {
         using var inputStream = new MemoryStream(compressedData);
         using var lzoStream = new LzoStream(inputStream, System.IO.Compression.CompressionMode.Decompress);
-        using var outputStream = new MemoryStream();
 
+        // The header gives the decompressed size; decode straight into it
+        var data = new byte[Math.Max(decompressedSize, 0)];
+        int total = lzoStream.ReadAtLeast(data, data.Length, throwOnEndOfStream: false);
+        if (total < data.Length)
+        {
+            Array.Resize(ref data, total);
+            return data;
+        }
+
+        // Keep any output beyond the declared size, as the stream produced it
         var buffer = new byte[4096];
-        int bytesRead;
-        while ((bytesRead = lzoStream.Read(buffer, 0, buffer.Length)) > 0)
+        int bytesRead = lzoStream.Read(buffer, 0, buffer.Length);
+        if (bytesRead == 0)
+        {
+            return data;
+        }
+
+        using var outputStream = new MemoryStream();
+        outputStream.Write(data);
+        do
         {
             outputStream.Write(buffer, 0, bytesRead);
         }
+        while ((bytesRead = lzoStream.Read(buffer, 0, buffer.Length)) > 0);
 
         return outputStream.ToArray();
     }
@@ -126,7 +151,28 @@ public class SnaReader
     /// </summary>
     public SnaBlock? GetBlock(byte module, byte id)
     {
-        return Blocks.FirstOrDefault(b => b.Module == module && b.Id == id);
+        ushort key = (ushort)((module << 8) | id);
+        return GetBlockIndex().GetValueOrDefault(key);
+    }
+
+    private Dictionary<ushort, SnaBlock> GetBlockIndex()
+    {
+        // Blocks is a public list, so rebuild if it has grown or shrunk since
+        var index = Volatile.Read(ref _blockIndex);
+        var count = Blocks.Count;
+        if (index == null || _indexedCount != count)
+        {
+            index = new Dictionary<ushort, SnaBlock>(count);
+            foreach (var block in Blocks)
+            {
+                index.TryAdd(block.Key, block);
+            }
+
+            // Record the count before publishing, so a reader that sees the new index sees its count too
+            _indexedCount = count;
+            Volatile.Write(ref _blockIndex, index);
+        }
+        return index;
     }
 
     /// <summary>
@@ -188,6 +234,11 @@ public class SnaReader
                 }
             }
         }
+        _blockIndex = null;
+        if (addedCount > 0 || replacedCount > 0)
+        {
+            Version++;
+        }
         Console.WriteLine($"    Merge: added {addedCount}, replaced {replacedCount} empty blocks, skipped {skippedCount}");
     }
 }
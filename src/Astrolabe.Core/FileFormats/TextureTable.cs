@@ -140,11 +140,25 @@ public class TextureTable
             return;
         }
 
-        int minAddr = _textureNames.Keys.Min();
-        int maxAddr = _textureNames.Keys.Max();
+        var (minAddr, maxAddr) = GetAddressRange();
         Console.WriteLine($"  TextureTable: {_textureNames.Count} entries, address range 0x{minAddr:X8} - 0x{maxAddr:X8}");
     }
 
+    /// <summary>
+    /// Gets the lowest and highest texture info address in one pass over the keys.
+    /// </summary>
+    private (int Min, int Max) GetAddressRange()
+    {
+        int min = int.MaxValue;
+        int max = int.MinValue;
+        foreach (var address in _textureNames.Keys)
+        {
+            if (address < min) min = address;
+            if (address > max) max = address;
+        }
+        return (min, max);
+    }
+
     private TextureEntry? ReadTextureInfo(int address)
     {
         if (_level == null)
@@ -309,8 +323,7 @@ public class TextureTable
         int added = _textureNames.Count - countBefore;
         if (added > 0)
         {
-            int minAddr = _textureNames.Keys.Min();
-            int maxAddr = _textureNames.Keys.Max();
+            var (minAddr, maxAddr) = GetAddressRange();
             Console.WriteLine($"  Merged {added} texture entries, total {_textureNames.Count}, range 0x{minAddr:X8} - 0x{maxAddr:X8}");
         }
     }
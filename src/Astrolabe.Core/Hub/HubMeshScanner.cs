@@ -1,4 +1,5 @@
 using System.Numerics;
+using System.Runtime.InteropServices;
 using Astrolabe.Core.FileFormats;
 using Astrolabe.Core.FileFormats.Geometry;
 using Astrolabe.Core.FileFormats.Materials;
@@ -49,7 +50,6 @@ public sealed class HubMeshScanner
             return null;
         }
 
-        var normals = LoadFloat3Array(_catalog.Resolve<Float3ArrayRecord>(geo.Normals));
         var elementTypes = LoadUInt16Array(_catalog.Resolve<UInt16ArrayRecord>(geo.ElementTypes));
         var elementPtrs = _catalog.Resolve<PointerArrayRecord>(geo.Elements);
         if (elementTypes == null || elementPtrs == null)
@@ -57,6 +57,8 @@ public sealed class HubMeshScanner
             return null;
         }
 
+        var normals = LoadFloat3Array(_catalog.Resolve<Float3ArrayRecord>(geo.Normals));
+
         var mesh = new MeshData
         {
             Name = $"geo_{virtualAddress:X8}",
@@ -91,15 +93,14 @@ public sealed class HubMeshScanner
                 continue;
             }
 
-            var indexOffset = allTriangles.Count;
-            allTriangles.AddRange(elementData.Triangles.Select(index => index + indexOffset));
+            AppendWithOffset(allTriangles, elementData.Triangles, allTriangles.Count);
             if (elementData.UVs != null)
             {
                 var uvBase = allUVs.Count;
                 allUVs.AddRange(elementData.UVs);
                 if (elementData.UVMapping != null)
                 {
-                    allUVIndices.AddRange(elementData.UVMapping.Select(uv => uv + uvBase));
+                    AppendWithOffset(allUVIndices, elementData.UVMapping, uvBase);
                 }
             }
 
@@ -139,9 +140,11 @@ public sealed class HubMeshScanner
 
         var element = new ElementData
         {
-            Triangles = triangles.Select(value => (int)value).ToArray(),
+            Triangles = WidenToInt(triangles),
             UVs = LoadFloat2Array(_catalog.Resolve<Float2ArrayRecord>(record.Uvs)),
-            UVMapping = LoadUInt16Array(_catalog.Resolve<UInt16ArrayRecord>(record.MappingUvs))?.Select(value => (int)value).ToArray()
+            UVMapping = LoadUInt16Array(_catalog.Resolve<UInt16ArrayRecord>(record.MappingUvs)) is { } mapping
+                ? WidenToInt(mapping)
+                : null
         };
 
         var gameMaterial = _catalog.Resolve<GameMaterialRecord>(record.Material);
@@ -167,15 +170,65 @@ public sealed class HubMeshScanner
         return element;
     }
 
-    private static Vector3[]? LoadFloat3Array(Float3ArrayRecord? record) =>
-        record?.Values?.Select(values => values.Length >= 3
-            ? new Vector3(values[0], values[1], values[2])
-            : Vector3.Zero).ToArray();
+    private static Vector3[]? LoadFloat3Array(Float3ArrayRecord? record)
+    {
+        var values = record?.Values;
+        if (values == null)
+        {
+            return null;
+        }
+
+        // Entries with too few components decode as zero
+        var result = new Vector3[values.Length];
+        for (var i = 0; i < values.Length; i++)
+        {
+            var value = values[i];
+            if (value.Length >= 3)
+            {
+                result[i] = new Vector3(value[0], value[1], value[2]);
+            }
+        }
 
-    private static Vector2[]? LoadFloat2Array(Float2ArrayRecord? record) =>
-        record?.Values?.Select(values => values.Length >= 2
-            ? new Vector2(values[0], values[1])
-            : Vector2.Zero).ToArray();
+        return result;
+    }
+
+    private static Vector2[]? LoadFloat2Array(Float2ArrayRecord? record)
+    {
+        var values = record?.Values;
+        if (values == null)
+        {
+            return null;
+        }
+
+        var result = new Vector2[values.Length];
+        for (var i = 0; i < values.Length; i++)
+        {
+            var value = values[i];
+            if (value.Length >= 2)
+            {
+                result[i] = new Vector2(value[0], value[1]);
+            }
+        }
+
+        return result;
+    }
+
+    /// <summary>
+    /// Appends values rebased by offset, growing the list once and writing into its storage.
+    /// </summary>
+    private static void AppendWithOffset(List<int> target, int[] values, int offset)
+    {
+        var start = target.Count;
+        CollectionsMarshal.SetCount(target, start + values.Length);
+        MeshScanner.AddOffset(values, offset, CollectionsMarshal.AsSpan(target)[start..]);
+    }
+
+    private static int[] WidenToInt(ushort[] values)
+    {
+        var result = new int[values.Length];
+        MeshScanner.WidenIndices(values, result);
+        return result;
+    }
 
     private static ushort[]? LoadUInt16Array(UInt16ArrayRecord? record) => record?.Values;
 }
\ No newline at end of file
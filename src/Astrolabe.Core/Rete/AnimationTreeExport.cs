@@ -136,7 +136,7 @@ internal static class AnimationTreeExport
                 record.TryGetProperty("data", out var dataProperty) &&
                 dataProperty.ValueKind == JsonValueKind.String)
             {
-                bytes = Convert.FromBase64String(dataProperty.GetString()!);
+                bytes = dataProperty.GetBytesFromBase64();
                 return true;
             }
 
@@ -1039,7 +1039,8 @@ internal static class AnimationTreeImporter
             writer.WriteEndObject();
         }
 
-        using var wrapped = JsonDocument.Parse(stream.ToArray());
+        // Parse the written buffer in place rather than copying the base64 payload out again
+        using var wrapped = JsonDocument.Parse(stream.GetBuffer().AsMemory(0, (int)stream.Length));
         return wrapped.RootElement.Clone();
     }
 
@@ -1051,7 +1052,7 @@ internal static class AnimationTreeImporter
             WriteRewrite(value, writer, rewrite);
         }
 
-        using var document = JsonDocument.Parse(stream.ToArray());
+        using var document = JsonDocument.Parse(stream.GetBuffer().AsMemory(0, (int)stream.Length));
         return document.RootElement.Clone();
     }
 
@@ -1141,7 +1142,7 @@ internal static class AnimationTreeImporter
             writer.WriteEndObject();
         }
 
-        using var document = JsonDocument.Parse(stream.ToArray());
+        using var document = JsonDocument.Parse(stream.GetBuffer().AsMemory(0, (int)stream.Length));
         return document.RootElement.Clone();
     }
 
@@ -66,22 +66,17 @@ internal static class OpenSpaceLzo
         {
             using var inputStream = new MemoryStream(compressedData.ToArray());
             using var lzoStream = new LzoStream(inputStream, CompressionMode.Decompress);
-            using var outputStream = new MemoryStream();
 
-            var buffer = new byte[4096];
-            int bytesRead;
-            while ((bytesRead = lzoStream.Read(buffer, 0, buffer.Length)) > 0)
+            // Output past the declared size is ignored, so decode straight into it
+            data = new byte[decompressedSize];
+            int total = lzoStream.ReadAtLeast(data, data.Length, throwOnEndOfStream: false);
+            if (total < data.Length)
             {
-                outputStream.Write(buffer, 0, bytesRead);
+                Array.Resize(ref data, total);
+                return false;
             }
 
-            data = outputStream.ToArray();
-            if (data.Length > decompressedSize)
-            {
-                Array.Resize(ref data, decompressedSize);
-            }
-
-            return data.Length == decompressedSize;
+            return true;
         }
         catch
         {
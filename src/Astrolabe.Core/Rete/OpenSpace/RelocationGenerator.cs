@@ -121,12 +121,25 @@ internal static class RelocationGenerator
         };
     }
 
-    internal static string? FindTargetBlockKey(string packageRoot, int address)
+    internal static string? FindTargetBlockKey(string packageRoot, int address) =>
+        FindTargetBlockKeys(packageRoot, [address])[0];
+
+    /// <summary>
+    /// Resolves many addresses against one load of the package layout, so callers
+    /// probing a whole element do not reparse the package per address.
+    /// </summary>
+    internal static string?[] FindTargetBlockKeys(string packageRoot, IReadOnlyList<int> addresses)
     {
         var layout = PackageLayout.Load(packageRoot);
-        return layout.TryFindBlock(address, out var block)
-            ? $"{block.Module:X2}:{block.Id:X2}"
-            : null;
+        var keys = new string?[addresses.Count];
+        for (var i = 0; i < keys.Length; i++)
+        {
+            keys[i] = layout.TryFindBlock(addresses[i], out var block)
+                ? $"{block.Module:X2}:{block.Id:X2}"
+                : null;
+        }
+
+        return keys;
     }
 
     private const byte UnmappedTargetModule = 0xFF;
@@ -512,9 +525,11 @@ internal static class RelocationGenerator
     {
         var preservedPointers = Flatten(preserved).ToHashSet();
         var generatedPointers = Flatten(generated).ToHashSet();
-        var matching = preservedPointers.Intersect(generatedPointers).Count();
-        var missingPointers = preservedPointers.Except(generatedPointers).Order().ToList();
-        var extraPointers = generatedPointers.Except(preservedPointers).Order().ToList();
+
+        // Probe the existing sets directly; Intersect/Except would each rebuild one
+        var missingPointers = preservedPointers.Where(p => !generatedPointers.Contains(p)).Order().ToList();
+        var extraPointers = generatedPointers.Where(p => !preservedPointers.Contains(p)).Order().ToList();
+        var matching = preservedPointers.Count - missingPointers.Count;
 
         return new RelocationComparisonResult(
             preserved.FileName,
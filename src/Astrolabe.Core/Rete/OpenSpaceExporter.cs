@@ -25,6 +25,9 @@ public static class OpenSpaceExporter
     public static string? FindTargetBlockKey(string packageRoot, int address) =>
         OpenSpace.RelocationGenerator.FindTargetBlockKey(packageRoot, address);
 
+    public static string?[] FindTargetBlockKeys(string packageRoot, IReadOnlyList<int> addresses) =>
+        OpenSpace.RelocationGenerator.FindTargetBlockKeys(packageRoot, addresses);
+
     public static RelocationTableDocument GenerateRtb(
         string packageRoot,
         string fileName,
@@ -2452,22 +2452,21 @@ internal static class OpenSpacePackageCodec
 
             foreach (var leaf in SnaBlockContentLinearizer.Linearize(intermediateDir, document))
             {
-                byte[] data;
                 if (leaf.DataPath.Contains('#', StringComparison.Ordinal) ||
                     StructCodecRegistry.TryGet(leaf.Kind, out _))
                 {
-                    data = ReferenceJson.WriteElementBytesForExport(
+                    stream.Write(ReferenceJson.WriteElementBytesForExport(
                         intermediateDir,
                         leaf.Kind,
                         leaf.DataPath,
-                        referenceResolver);
+                        referenceResolver));
                 }
                 else
                 {
-                    data = File.ReadAllBytes(ResolvePath(intermediateDir, leaf.DataPath));
+                    // Raw leaves are copied straight into the block instead of through a per-file array
+                    using var file = File.OpenRead(ResolvePath(intermediateDir, leaf.DataPath));
+                    file.CopyTo(stream);
                 }
-
-                stream.Write(data);
             }
 
             return stream.ToArray();
@@ -561,7 +561,7 @@ internal sealed class RetePackageAddressIndex
                     poolRecord.TryGetProperty("data", out var dataB64) &&
                     dataB64.ValueKind == JsonValueKind.String)
                 {
-                    return Convert.FromBase64String(dataB64.GetString()!).Length;
+                    return GetBase64DecodedLength(dataB64.GetString()!);
                 }
             }
 
@@ -598,6 +598,22 @@ internal sealed class RetePackageAddressIndex
         return 0;
     }
 
+    /// <summary>
+    /// Computes the decoded size of a base64 payload without decoding it.
+    /// </summary>
+    private static int GetBase64DecodedLength(string base64)
+    {
+        if (base64.Length % 4 != 0)
+        {
+            return Convert.FromBase64String(base64).Length;
+        }
+
+        var padding = base64.EndsWith("==", StringComparison.Ordinal) ? 2
+            : base64.EndsWith('=') ? 1
+            : 0;
+        return base64.Length / 4 * 3 - padding;
+    }
+
     private static AnimationTreeStore LoadAnimStore(string packageRoot)
     {
         var store = new AnimationTreeStore();
@@ -39,7 +39,10 @@ internal static class ReferenceJson
             }
         }
 
-        File.WriteAllBytes(jsonPath, stream.ToArray());
+        using (var file = File.Create(jsonPath))
+        {
+            stream.WriteTo(file);
+        }
         return true;
     }
 
@@ -323,7 +326,10 @@ internal static class ReferenceJson
             writer.Flush();
         }
 
-        File.WriteAllBytes(jsonPath, stream.ToArray());
+        using (var file = File.Create(jsonPath))
+        {
+            stream.WriteTo(file);
+        }
     }
 
     private static int OrderPointerOffset(string value) =>
@@ -212,7 +212,7 @@ internal static class SceneTreeAggregator
             writer.WriteEndObject();
         }
 
-        using var doc = JsonDocument.Parse(stream.ToArray());
+        using var doc = JsonDocument.Parse(stream.GetBuffer().AsMemory(0, (int)stream.Length));
         return doc.RootElement.Clone();
     }
 
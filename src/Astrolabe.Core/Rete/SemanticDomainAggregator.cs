@@ -190,13 +190,19 @@ internal static class SemanticDomainAggregator
         else
         {
             // Binary leaf — store as opaque base64 record for lossless export.
+            // Encode straight into the UTF-8 JSON buffer rather than via an intermediate string.
             var bytes = File.ReadAllBytes(fullPath);
-            var json = JsonSerializer.SerializeToElement(new
+            using var stream = new MemoryStream();
+            using (var writer = new Utf8JsonWriter(stream))
             {
-                schema = $"astrolabe.{element.Kind}.v1",
-                data = Convert.ToBase64String(bytes)
-            });
-            node.Record = json;
+                writer.WriteStartObject();
+                writer.WriteString("schema", $"astrolabe.{element.Kind}.v1");
+                writer.WriteBase64String("data", bytes);
+                writer.WriteEndObject();
+            }
+
+            using var doc = JsonDocument.Parse(stream.GetBuffer().AsMemory(0, (int)stream.Length));
+            node.Record = doc.RootElement.Clone();
         }
 
         return node;
@@ -260,7 +266,7 @@ internal static class SemanticDomainAggregator
             writer.WriteEndObject();
         }
 
-        using var doc = JsonDocument.Parse(stream.ToArray());
+        using var doc = JsonDocument.Parse(stream.GetBuffer().AsMemory(0, (int)stream.Length));
         return doc.RootElement.Clone();
     }
 
@@ -395,7 +401,7 @@ internal static class SemanticDomainAggregator
             writer.WriteEndObject();
         }
 
-        using var doc = JsonDocument.Parse(stream.ToArray());
+        using var doc = JsonDocument.Parse(stream.GetBuffer().AsMemory(0, (int)stream.Length));
         return doc.RootElement.Clone();
     }
 
@@ -528,10 +534,10 @@ internal static class SemanticDomainAggregator
         if (record.TryGetProperty("data", out var dataProp) &&
             dataProp.ValueKind == JsonValueKind.String)
         {
-            var s = dataProp.GetString();
-            if (!string.IsNullOrEmpty(s))
+            var bytes = dataProp.GetBytesFromBase64();
+            if (bytes.Length > 0)
             {
-                return Convert.FromBase64String(s);
+                return bytes;
             }
         }
 
@@ -150,7 +150,7 @@ internal static class SemanticPoolExport
             dataProp.ValueKind == JsonValueKind.String &&
             !StructCodecRegistry.TryGet(node.Kind, out _))
         {
-            return Convert.FromBase64String(dataProp.GetString()!);
+            return dataProp.GetBytesFromBase64();
         }
 
         // Dense buffer descriptor with path.
@@ -181,7 +181,7 @@ internal static class SemanticPoolExport
                 record.TryGetProperty("data", out var dataProp) &&
                 dataProp.ValueKind == JsonValueKind.String)
             {
-                return Convert.FromBase64String(dataProp.GetString()!);
+                return dataProp.GetBytesFromBase64();
             }
 
             throw new InvalidDataException($"Unsupported semantic pool kind: {kind}");
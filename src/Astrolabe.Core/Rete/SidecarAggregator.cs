@@ -33,6 +33,10 @@ internal static class SidecarAggregator
         PropertyNameCaseInsensitive = true
     };
 
+    // Output paths that differ only by case name the same file everywhere but Linux
+    private static readonly StringComparer OutputPathComparer =
+        OperatingSystem.IsLinux() ? StringComparer.Ordinal : StringComparer.OrdinalIgnoreCase;
+
     private const string TextureScheme = "texture:/";
     private const string SoundScheme = "sound:/";
     private const string TexturesMirror = "Gamedata/Textures";
@@ -116,7 +120,12 @@ internal static class SidecarAggregator
 
         var outPath = Path.Combine(packageDir, SidecarDocument.RelativePath.Replace('/', Path.DirectorySeparatorChar));
         Directory.CreateDirectory(Path.GetDirectoryName(outPath)!);
-        File.WriteAllText(outPath, JsonSerializer.Serialize(doc, JsonOptions));
+        // The document carries whole sidecar files as Base64, so serialize straight to the
+        // file as UTF-8 rather than building the full JSON text in memory first
+        using (var file = File.Create(outPath))
+        {
+            JsonSerializer.Serialize(file, doc, JsonOptions);
+        }
 
         // Remove opaque pass-through as long-term source of truth (keep bytes in sidecar doc).
         foreach (var loose in removedLoose)
@@ -280,7 +289,7 @@ internal static class SidecarAggregator
         return names;
     }
 
-    private static bool TryDecodeReferencedTextures(
+    internal static bool TryDecodeReferencedTextures(
         IReadOnlyList<string> cntPaths,
         IReadOnlyList<string> names,
         string levelName,
@@ -385,44 +394,45 @@ internal static class SidecarAggregator
                 targets = [];
             }
 
-            foreach (var entry in targets)
+            // GF decode and PNG encode are CPU-bound and independent per output file; URIs
+            // are still reported afterwards in target order.
+            var work = targets.ToList();
+            var pngRelPaths = new string[work.Count];
+            for (var i = 0; i < work.Count; i++)
             {
-                try
-                {
-                    var relInside = Path.ChangeExtension(entry.FullPath.Replace('\\', '/'), ".png")!;
-                    var pngRel = $"{mirrorRoot}/{relInside}".Replace("//", "/");
-                    var pngAbs = Path.Combine(
-                        outputRoot,
-                        pngRel.Replace('/', Path.DirectorySeparatorChar));
+                var relInside = Path.ChangeExtension(work[i].FullPath.Replace('\\', '/'), ".png")!;
+                pngRelPaths[i] = $"{mirrorRoot}/{relInside}".Replace("//", "/");
+            }
 
-                    if (!File.Exists(pngAbs))
+            // Targets that map to the same PNG run serially within one group, so a file is
+            // written once and later targets see it on disk, as in a serial pass.
+            var groups = Enumerable.Range(0, work.Count)
+                .GroupBy(i => pngRelPaths[i], OutputPathComparer)
+                .Select(g => g.ToArray())
+                .ToList();
+            var pngRels = new string?[work.Count];
+            var anyDecoded = 0;
+            Parallel.ForEach(groups, group =>
+            {
+                foreach (var i in group)
+                {
+                    if (TryWriteTexturePng(cnt, work[i], isVignette, outputRoot, pngRelPaths[i], out var wrote))
                     {
-                        var data = cnt.ExtractFile(entry);
-                        var gf = new GfReader(data)
-                        {
-                            IsVignette = isVignette || (/* width check after parse */ false)
-                        };
-                        // GfReader sets dimensions in ctor; re-check vignette heuristic.
-                        if (!isVignette && gf.Width == 640 && gf.Height == 480)
-                        {
-                            gf.IsVignette = true;
-                        }
-
-                        var dir = Path.GetDirectoryName(pngAbs);
-                        if (!string.IsNullOrEmpty(dir))
+                        pngRels[i] = pngRelPaths[i];
+                        if (wrote)
                         {
-                            Directory.CreateDirectory(dir);
+                            Interlocked.Exchange(ref anyDecoded, 1);
                         }
-
-                        gf.SaveAsPng(pngAbs);
-                        decoded = true;
                     }
-
-                    addUri(TextureScheme + pngRel);
                 }
-                catch
+            });
+
+            decoded |= anyDecoded != 0;
+            foreach (var pngRel in pngRels)
+            {
+                if (pngRel != null)
                 {
-                    // skip individual GF failures
+                    addUri(TextureScheme + pngRel);
                 }
             }
 
@@ -432,6 +442,53 @@ internal static class SidecarAggregator
         return decoded;
     }
 
+    private static bool TryWriteTexturePng(
+        CntReader cnt,
+        CntFileEntry entry,
+        bool isVignette,
+        string outputRoot,
+        string pngRel,
+        out bool wrote)
+    {
+        wrote = false;
+        try
+        {
+            var pngAbs = Path.Combine(
+                outputRoot,
+                pngRel.Replace('/', Path.DirectorySeparatorChar));
+
+            if (!File.Exists(pngAbs))
+            {
+                var data = cnt.ExtractFile(entry);
+                var gf = new GfReader(data)
+                {
+                    IsVignette = isVignette || (/* width check after parse */ false)
+                };
+                // GfReader sets dimensions in ctor; re-check vignette heuristic.
+                if (!isVignette && gf.Width == 640 && gf.Height == 480)
+                {
+                    gf.IsVignette = true;
+                }
+
+                var dir = Path.GetDirectoryName(pngAbs);
+                if (!string.IsNullOrEmpty(dir))
+                {
+                    Directory.CreateDirectory(dir);
+                }
+
+                gf.SaveAsPng(pngAbs);
+                wrote = true;
+            }
+
+            return true;
+        }
+        catch
+        {
+            // skip individual GF failures
+            return false;
+        }
+    }
+
     private static void CollectExistingTextureUris(
         string outputRoot,
         string levelName,
@@ -805,14 +862,7 @@ internal static class SidecarAggregator
         out byte[] bytes)
     {
         bytes = [];
-        var path = Path.Combine(packageDir, SidecarDocument.RelativePath.Replace('/', Path.DirectorySeparatorChar));
-        if (!File.Exists(path))
-        {
-            return false;
-        }
-
-        var doc = JsonSerializer.Deserialize<SidecarDocument>(File.ReadAllText(path), JsonOptions);
-        if (doc == null)
+        if (!TryLoadDocument(packageDir, out var doc))
         {
             return false;
         }
@@ -852,7 +902,12 @@ internal static class SidecarAggregator
             return false;
         }
 
-        var doc = JsonSerializer.Deserialize<SidecarDocument>(File.ReadAllText(path), JsonOptions);
+        SidecarDocument? doc;
+        using (var file = File.OpenRead(path))
+        {
+            doc = JsonSerializer.Deserialize<SidecarDocument>(file, JsonOptions);
+        }
+
         if (doc == null)
         {
             return false;
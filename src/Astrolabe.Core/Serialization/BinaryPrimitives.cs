@@ -1,4 +1,5 @@
 using System.Buffers.Binary;
+using System.Runtime.InteropServices;
 
 namespace Astrolabe.Core.Serialization;
 
@@ -35,6 +36,25 @@ internal static class StructBinaryIO
     public static float ReadSingle(ReadOnlySpan<byte> data, int offset) =>
         BinaryPrimitives.ReadSingleLittleEndian(data.Slice(offset, 4));
 
+    /// <summary>
+    /// Reads destination.Length consecutive floats starting at offset in one call.
+    /// </summary>
+    public static void ReadSingles(ReadOnlySpan<byte> data, int offset, Span<float> destination)
+    {
+        var source = data.Slice(offset, destination.Length * 4);
+        if (BitConverter.IsLittleEndian)
+        {
+            // Stored layout already matches, so reinterpret and copy as a block
+            MemoryMarshal.Cast<byte, float>(source).CopyTo(destination);
+            return;
+        }
+
+        for (var i = 0; i < destination.Length; i++)
+        {
+            destination[i] = BinaryPrimitives.ReadSingleLittleEndian(source.Slice(i * 4, 4));
+        }
+    }
+
     public static void WriteSingle(Span<byte> destination, int offset, float value) =>
         BinaryPrimitives.WriteSingleLittleEndian(destination.Slice(offset, 4), value);
 
@@ -53,6 +73,21 @@ internal static class StructBinaryIO
     public static ushort ReadUInt16(ReadOnlySpan<byte> data, int offset) =>
         BinaryPrimitives.ReadUInt16LittleEndian(data.Slice(offset, 2));
 
+    /// <summary>
+    /// Reads destination.Length consecutive uint16 values starting at offset in one call.
+    /// </summary>
+    public static void ReadUInt16s(ReadOnlySpan<byte> data, int offset, Span<ushort> destination)
+    {
+        var source = MemoryMarshal.Cast<byte, ushort>(data.Slice(offset, destination.Length * 2));
+        if (BitConverter.IsLittleEndian)
+        {
+            source.CopyTo(destination);
+            return;
+        }
+
+        BinaryPrimitives.ReverseEndianness(source, destination);
+    }
+
     public static void WriteUInt16(Span<byte> destination, int offset, ushort value) =>
         BinaryPrimitives.WriteUInt16LittleEndian(destination.Slice(offset, 2), value);
 
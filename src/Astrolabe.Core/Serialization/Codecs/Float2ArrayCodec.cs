@@ -28,11 +28,9 @@ public sealed class Float2ArrayCodec : IStructCodec<Float2ArrayRecord>
         var values = new float[length / 8][];
         for (var i = 0; i < values.Length; i++)
         {
-            values[i] =
-            [
-                StructBinaryIO.ReadSingle(slice, i * 8),
-                StructBinaryIO.ReadSingle(slice, i * 8 + 4)
-            ];
+            var entry = new float[2];
+            StructBinaryIO.ReadSingles(slice, i * 8, entry);
+            values[i] = entry;
         }
 
         return new Float2ArrayRecord { Type = Kind, Values = values };
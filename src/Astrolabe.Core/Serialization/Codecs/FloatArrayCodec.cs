@@ -26,10 +26,7 @@ public sealed class FloatArrayCodec : IStructCodec<FloatArrayRecord>
 
         var slice = data.Slice(offset, length);
         var values = new float[length / 4];
-        for (var i = 0; i < values.Length; i++)
-        {
-            values[i] = StructBinaryIO.ReadSingle(slice, i * 4);
-        }
+        StructBinaryIO.ReadSingles(slice, 0, values);
 
         return new FloatArrayRecord { Type = Kind, Values = values };
     }
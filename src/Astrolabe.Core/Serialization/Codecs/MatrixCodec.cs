@@ -39,7 +39,7 @@ public sealed class MatrixCodec : IStructCodec<MatrixRecord>
         const int headerSize = 0x34;
         if (length > headerSize)
         {
-            matrix.ExtraBase64 = Convert.ToBase64String(slice.Slice(headerSize).ToArray());
+            matrix.ExtraBase64 = Convert.ToBase64String(slice.Slice(headerSize));
         }
 
         return matrix;
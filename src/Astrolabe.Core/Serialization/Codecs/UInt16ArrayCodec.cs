@@ -27,12 +27,8 @@ public sealed class UInt16ArrayCodec : IStructCodec<UInt16ArrayRecord>
             throw new InvalidDataException($"{Kind} length {length} is not a multiple of 2.");
         }
 
-        var slice = data.Slice(offset, length);
         var values = new ushort[length / 2];
-        for (var i = 0; i < values.Length; i++)
-        {
-            values[i] = StructBinaryIO.ReadUInt16(slice, i * 2);
-        }
+        StructBinaryIO.ReadUInt16s(data, offset, values);
 
         return new UInt16ArrayRecord { Type = Kind, Values = values };
     }
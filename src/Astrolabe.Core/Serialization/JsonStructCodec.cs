@@ -55,10 +55,7 @@ internal static class JsonStructCodec
             throw new ArgumentException("Destination must contain exactly 3 floats.", nameof(destination));
         }
 
-        for (var i = 0; i < 3; i++)
-        {
-            destination[i] = StructBinaryIO.ReadSingle(data, offset + i * 4);
-        }
+        StructBinaryIO.ReadSingles(data, offset, destination);
     }
 
     public static void WriteIntArray(Span<byte> destination, int offset, IReadOnlyList<int> values, int expectedLength, string fieldName)